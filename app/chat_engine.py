@@ -1,18 +1,134 @@
 """Chat engine: AI explanations based on scouting data using OpenAI or Gemini."""
 
-import json
+import asyncio
+import hashlib
 import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
-import requests
+import httpx
+
+from app.json_utils import dumps, dumps_bytes, loads
 
 
 OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
 GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/models"
 
+# On-disk cache of answers for identical (provider, model, prompt) requests; off unless
+# CHAT_CACHE_TTL > 0. Settings are read once per chat call (see _cache_settings).
+CHAT_CACHE_MAX_ENTRIES_DEFAULT = 256
+
+CHAT_SYSTEM_PROMPT = (
+    "You are a coach assistant for esports. Use ONLY the provided scouting report JSON to answer. "
+    "Be concise and specific. If the report does not contain relevant data, say so."
+)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_client: httpx.AsyncClient | None = None
+
+
+def _new_client() -> httpx.AsyncClient:
+    """Create a pooled keep-alive async client for chat provider calls."""
+    # Limits go on the transport; httpx ignores client-level limits when a transport is passed
+    return httpx.AsyncClient(
+        timeout=60,
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        ),
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared async client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _new_client()
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared chat client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _cache_key(provider: str, model: str, system_content: str, user_content: str) -> str:
+    """Return the sha256 hex digest identifying one chat request."""
+    h = hashlib.sha256()
+    for part in (provider, model, system_content, user_content):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _cache_settings() -> tuple[int, Path, int]:
+    """(ttl seconds, directory, max entries) from CHAT_CACHE_TTL / CHAT_CACHE_DIR / CHAT_CACHE_MAX_ENTRIES."""
+    ttl = int(os.environ.get("CHAT_CACHE_TTL") or 0)
+    cache_dir = Path(os.environ.get("CHAT_CACHE_DIR") or Path(tempfile.gettempdir()) / "coach_chat_cache")
+    max_entries = int(os.environ.get("CHAT_CACHE_MAX_ENTRIES") or CHAT_CACHE_MAX_ENTRIES_DEFAULT)
+    return ttl, cache_dir, max_entries
+
+
+def _cache_get(key: str, ttl: int, cache_dir: Path) -> str | None:
+    """Return a cached, unexpired response text for key, or None. Blocking; run it in a thread."""
+    path = cache_dir / f"{key}.json"
+    try:
+        entry = loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or time.time() - (entry.get("created") or 0) > ttl:
+        path.unlink(missing_ok=True)
+        return None
+    text = entry.get("response")
+    return text if isinstance(text, str) else None
+
+
+def _cache_prune(cache_dir: Path, ttl: int, max_entries: int) -> None:
+    """Delete expired entries, then the oldest ones beyond max_entries."""
+    cutoff = time.time() - ttl
+    entries: list[tuple[float, Path]] = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+        if mtime < cutoff:
+            path.unlink(missing_ok=True)
+        else:
+            entries.append((mtime, path))
+    if len(entries) > max_entries:
+        entries.sort()
+        for _, path in entries[: len(entries) - max_entries]:
+            path.unlink(missing_ok=True)
+
+
+def _cache_set(key: str, text: str, ttl: int, cache_dir: Path, max_entries: int) -> None:
+    """Store response text for key and prune the directory. Best effort; blocking, run it in a thread."""
+    path = cache_dir / f"{key}.json"
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(dumps_bytes({"created": time.time(), "response": text}))
+        os.replace(tmp, path)
+        _cache_prune(cache_dir, ttl, max_entries)
+    except OSError:
+        pass
+
 
+@lru_cache(maxsize=1)
 def _get_provider_and_key() -> tuple[str | None, str | None]:
-    """Return (provider, api_key) from env. Prefer OPENAI if both set."""
+    """Return (provider, api_key) from env. Prefer OPENAI if both set.
+
+    Resolved once and cached; call `_get_provider_and_key.cache_clear()` after
+    changing CHAT_PROVIDER / OPENAI_API_KEY / GEMINI_API_KEY at runtime.
+    """
     provider = (os.environ.get("CHAT_PROVIDER") or "").lower().strip()
     openai_key = os.environ.get("OPENAI_API_KEY")
     gemini_key = os.environ.get("GEMINI_API_KEY")
@@ -28,10 +144,25 @@ def _get_provider_and_key() -> tuple[str | None, str | None]:
     return None, None
 
 
-def _call_openai(api_key: str, system_content: str, user_content: str) -> str:
+def _model_for(provider: str) -> str:
+    """Model name for provider, read per call so .env / runtime overrides apply (OPENAI_MODEL / GEMINI_MODEL)."""
+    if provider == "openai":
+        return os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+    return os.environ.get("GEMINI_MODEL", "gemini-1.5-flash")
+
+
+@lru_cache(maxsize=4)
+def _openai_headers(api_key: str) -> dict[str, str]:
+    """Return the (reused) auth + content-type headers for an OpenAI key."""
+    return {"Authorization": f"Bearer {api_key}", **JSON_HEADERS}
+
+
+async def _call_openai(
+    client: httpx.AsyncClient, api_key: str, model: str, system_content: str, user_content: str
+) -> str:
     """Call OpenAI Chat Completions and return assistant message text."""
     payload = {
-        "model": os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+        "model": model,
         "messages": [
             {"role": "system", "content": system_content},
             {"role": "user", "content": user_content},
@@ -39,17 +170,9 @@ def _call_openai(api_key: str, system_content: str, user_content: str) -> str:
         "max_tokens": 1024,
         "temperature": 0.3,
     }
-    resp = requests.post(
-        OPENAI_CHAT_URL,
-        json=payload,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        timeout=60,
-    )
+    resp = await client.post(OPENAI_CHAT_URL, content=dumps_bytes(payload), headers=_openai_headers(api_key))
     resp.raise_for_status()
-    data = resp.json()
+    data = loads(resp.content)
     choice = (data.get("choices") or [None])[0]
     if not choice:
         raise ValueError("OpenAI response had no choices")
@@ -57,18 +180,19 @@ def _call_openai(api_key: str, system_content: str, user_content: str) -> str:
     return (msg.get("content") or "").strip()
 
 
-def _call_gemini(api_key: str, system_content: str, user_content: str) -> str:
+async def _call_gemini(
+    client: httpx.AsyncClient, api_key: str, model: str, system_content: str, user_content: str
+) -> str:
     """Call Gemini generateContent and return text."""
-    model = os.environ.get("GEMINI_MODEL", "gemini-1.5-flash")
     url = f"{GEMINI_BASE_URL}/{model}:generateContent?key={api_key}"
     payload = {
         "systemInstruction": {"parts": [{"text": system_content}]},
         "contents": [{"role": "user", "parts": [{"text": user_content}]}],
         "generationConfig": {"maxOutputTokens": 1024, "temperature": 0.3},
     }
-    resp = requests.post(url, json=payload, headers={"Content-Type": "application/json"}, timeout=60)
+    resp = await client.post(url, content=dumps_bytes(payload), headers=JSON_HEADERS)
     resp.raise_for_status()
-    data = resp.json()
+    data = loads(resp.content)
     cands = (data.get("candidates") or [None])[0]
     if not cands:
         raise ValueError("Gemini response had no candidates")
@@ -78,16 +202,23 @@ def _call_gemini(api_key: str, system_content: str, user_content: str) -> str:
     return (parts[0].get("text") or "").strip()
 
 
-def generate_chat_response(user_question: str, scouting_report_json: dict[str, Any] | None) -> dict[str, Any]:
+async def generate_chat_response_async(
+    user_question: str,
+    scouting_report_json: dict[str, Any] | None,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, Any]:
     """
     Generate an AI explanation based on the user's question and scouting report data.
 
     Uses OpenAI (OPENAI_API_KEY) or Gemini (GEMINI_API_KEY). Set CHAT_PROVIDER
     to "openai" or "gemini" to force one; otherwise OpenAI is preferred if both keys exist.
+    Successful answers are cached on disk for CHAT_CACHE_TTL seconds when it is set
+    (default 0: off), keeping at most CHAT_CACHE_MAX_ENTRIES files.
 
     Args:
         user_question: The user's question (e.g. "What are our main weaknesses?").
         scouting_report_json: Scouting report dict (e.g. from POST /generate-scouting-report).
+        client: Optional httpx client; defaults to the shared module client.
 
     Returns:
         {
@@ -104,20 +235,41 @@ def generate_chat_response(user_question: str, scouting_report_json: dict[str, A
             "error": "No chat API key set. Set OPENAI_API_KEY or GEMINI_API_KEY in .env",
         }
 
-    report_str = json.dumps(scouting_report_json or {}, indent=2)
-    system_content = (
-        "You are a coach assistant for esports. Use ONLY the provided scouting report JSON to answer. "
-        "Be concise and specific. If the report does not contain relevant data, say so."
-    )
-    user_content = f"Scouting report:\n{report_str}\n\nQuestion: {user_question}"
+    # Compact encoding keeps the prompt (and token cost) small; the report string is built
+    # inline so only user_content stays alive while the upstream call is in flight.
+    user_content = f"Scouting report:\n{dumps(scouting_report_json or {})}\n\nQuestion: {user_question}"
+    system_content = CHAT_SYSTEM_PROMPT
+
+    model = _model_for(provider)
+    # With the cache off (the default) no key is hashed and no thread-pool hop is made
+    cache_ttl, cache_dir, cache_max_entries = _cache_settings()
+    cache_key = None
+    if cache_ttl > 0:
+        cache_key = _cache_key(provider, model, system_content, user_content)
+        cached = await asyncio.to_thread(_cache_get, cache_key, cache_ttl, cache_dir)
+        if cached is not None:
+            return {"response": cached, "provider": provider, "error": None}
 
+    client = client or _get_client()
     try:
         if provider == "openai":
-            text = _call_openai(api_key, system_content, user_content)
+            text = await _call_openai(client, api_key, model, system_content, user_content)
         else:
-            text = _call_gemini(api_key, system_content, user_content)
+            text = await _call_gemini(client, api_key, model, system_content, user_content)
+        if cache_key is not None:
+            await asyncio.to_thread(_cache_set, cache_key, text, cache_ttl, cache_dir, cache_max_entries)
         return {"response": text, "provider": provider, "error": None}
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         return {"response": "", "provider": provider, "error": f"API request failed: {e!s}"}
     except (ValueError, KeyError) as e:
         return {"response": "", "provider": provider, "error": f"API response error: {e!s}"}
+
+
+def generate_chat_response(user_question: str, scouting_report_json: dict[str, Any] | None) -> dict[str, Any]:
+    """Synchronous wrapper around generate_chat_response_async for non-async callers."""
+
+    async def _run() -> dict[str, Any]:
+        async with _new_client() as client:
+            return await generate_chat_response_async(user_question, scouting_report_json, client=client)
+
+    return asyncio.run(_run())
@@ -19,29 +19,38 @@ Champion metadata includes:
 
 from __future__ import annotations
 
-import json
+import sys
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.json_utils import loads
 
 
 # --- Champion metadata: role, damage type, synergy tags, frontline/carry ------
 
-@dataclass(frozen=True)
+CHAMPIONS_JSON_PATH = Path(__file__).resolve().parent / "data" / "champions.json"
+
+
+@dataclass(frozen=True, slots=True)
 class ChampionMeta:
     default_role: str | None
     damage_type: str | None  # "physical" | "magic" | "mixed" | "true"
-    tags: List[str]  # synergy + frontline/carry: tank, frontline, carry, hyper_carry, dps, engage, teamfight, pick, aoe, scaling, poke
+    tags: Tuple[str, ...]  # synergy + frontline/carry: tank, frontline, carry, hyper_carry, dps, engage, teamfight, pick, aoe, scaling, poke
+    name: str = ""  # display name as listed in champions.json (e.g. "Miss Fortune")
 
 
 def _load_champion_metadata() -> Dict[str, ChampionMeta]:
     """Load champion metadata from app/data/champions.json. Falls back to minimal dict on error."""
     try:
-        path = Path(__file__).resolve().parent / "data" / "champions.json"
-        if not path.exists():
+        try:
+            raw = CHAMPIONS_JSON_PATH.read_bytes()
+        except FileNotFoundError:
             return _fallback_champion_metadata()
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = loads(raw)
         champions = data.get("champions", data) if isinstance(data, dict) else (data if isinstance(data, list) else [])
         result: Dict[str, ChampionMeta] = {}
         for entry in champions:
@@ -51,11 +60,12 @@ def _load_champion_metadata() -> Dict[str, ChampionMeta]:
             if not name:
                 continue
             key = name.lower()
-            role = (entry.get("role") or "").strip().lower() or None
-            damage_type = (entry.get("damage_type") or "").strip().lower() or None
+            # Intern the small closed vocabularies so all champions share one string object per value
+            role = sys.intern((entry.get("role") or "").strip().lower()) or None
+            damage_type = sys.intern((entry.get("damage_type") or "").strip().lower()) or None
             tags_raw = entry.get("tags")
-            tags = [str(t).strip().lower() for t in (tags_raw if isinstance(tags_raw, list) else []) if t]
-            result[key] = ChampionMeta(default_role=role, damage_type=damage_type, tags=tags)
+            tags = tuple(sys.intern(str(t).strip().lower()) for t in (tags_raw if isinstance(tags_raw, list) else []) if t)
+            result[key] = ChampionMeta(default_role=role, damage_type=damage_type, tags=tags, name=name)
         return result if result else _fallback_champion_metadata()
     except Exception:
         return _fallback_champion_metadata()
@@ -64,51 +74,113 @@ def _load_champion_metadata() -> Dict[str, ChampionMeta]:
 def _fallback_champion_metadata() -> Dict[str, ChampionMeta]:
     """Minimal metadata when JSON is missing or invalid."""
     return {
-        "ahri": ChampionMeta("mid", "magic", ["pick", "burst", "mobility"]),
-        "amumu": ChampionMeta("jungle", "magic", ["tank", "frontline", "engage", "teamfight"]),
-        "vayne": ChampionMeta("adc", "physical", ["hyper_carry", "scaling", "dps"]),
-        "thresh": ChampionMeta("support", "magic", ["frontline", "engage", "pick", "utility"]),
+        "ahri": ChampionMeta("mid", "magic", ("pick", "burst", "mobility"), "Ahri"),
+        "amumu": ChampionMeta("jungle", "magic", ("tank", "frontline", "engage", "teamfight"), "Amumu"),
+        "vayne": ChampionMeta("adc", "physical", ("hyper_carry", "scaling", "dps"), "Vayne"),
+        "thresh": ChampionMeta("support", "magic", ("frontline", "engage", "pick", "utility"), "Thresh"),
     }
 
 
 CHAMPION_METADATA: Dict[str, ChampionMeta] = _load_champion_metadata()
 
+# Struct-of-arrays view of CHAMPION_METADATA, indexed by CHAMP_ID[name_lower] (display
+# names are aliased too, so "Ahri" resolves without lowercasing).
+# Tags are deduplicated, lowercased tuples in their original order.
+CHAMP_ID: Dict[str, int] = {}
+CHAMP_ROLES: List[Optional[str]] = []
+CHAMP_DAMAGE: List[Optional[str]] = []
+CHAMP_TAGS: List[Tuple[str, ...]] = []
+for _name, _meta in CHAMPION_METADATA.items():
+    CHAMP_ID[_name] = len(CHAMP_ROLES)
+    if _meta.name:
+        CHAMP_ID.setdefault(_meta.name, CHAMP_ID[_name])
+    CHAMP_ROLES.append(_meta.default_role)
+    CHAMP_DAMAGE.append(_meta.damage_type)
+    CHAMP_TAGS.append(tuple(dict.fromkeys(_meta.tags)))
+del _name, _meta
+
 REQUIRED_ROLES = ["top", "jungle", "mid", "adc", "support"]
 
 # Default role by pick order when champion is unknown (1–5)
 DEFAULT_ROLE_BY_INDEX = ["top", "jungle", "mid", "adc", "support"]
 
-
-def _normalize_pick(pick: Any) -> Dict[str, Any]:
-    """Normalize a draft pick (string or dict) into a standard dict."""
+# Tag groups for frontline / carry presence in a comp
+FRONTLINE_TAGS = frozenset({"tank", "frontline"})
+CARRY_TAGS = frozenset({"hyper_carry", "carry", "dps"})
+
+# Score labels indexed by how many of the 40 / 70 thresholds a score reaches
+SYNERGY_LABELS = ("low", "medium", "high")
+DAMAGE_BALANCE_LABELS = ("one_dimensional", "leaning", "balanced")
+
+# Role coverage status indexed by (has_missing << 1) | has_duplicates
+ROLE_COVERAGE_STATUS = ("complete", "overlapping", "incomplete", "incomplete")
+
+# Damage type (incl. ad/ap aliases) -> damage composition bucket; anything else is "unknown"
+DAMAGE_TYPE_BUCKETS = {
+    "physical": "physical",
+    "ad": "physical",
+    "magic": "magic",
+    "ap": "magic",
+    "mixed": "mixed",
+    "true": "true",
+}
+
+# Known lowercase role / damage type / tag tokens, mapped to their interned instance
+CANONICAL_TOKENS: Dict[str, str] = {
+    t: t
+    for t in chain(
+        REQUIRED_ROLES,
+        DAMAGE_TYPE_BUCKETS,
+        FRONTLINE_TAGS,
+        CARRY_TAGS,
+        (r for r in CHAMP_ROLES if r),
+        (d for d in CHAMP_DAMAGE if d),
+        chain.from_iterable(CHAMP_TAGS),
+    )
+}
+
+
+def _canonical_token(value: str) -> str:
+    """Lowercased, interned form of value; known tokens skip the lower() allocation."""
+    return CANONICAL_TOKENS.get(value) or sys.intern(value.lower())
+
+
+# Canonical pick key: (champion, role, damage_type, tags). Role, damage type and tags are
+# lowercased (and interned) here once, so downstream passes compare them as-is.
+PickKey = Tuple[str, Optional[str], Optional[str], Tuple[str, ...]]
+
+
+def _pick_key(pick: Any) -> PickKey:
+    """Reduce a draft pick (string or dict) to a hashable canonical key."""
     if isinstance(pick, str):
-        champ_name = pick
-        role = None
-        dmg_type = None
-        tags: List[str] = []
-    elif isinstance(pick, dict):
+        return (pick.strip(), None, None, ())
+    if isinstance(pick, dict):
         champ_name = pick.get("champion") or pick.get("name") or pick.get("id") or ""
-        role = (pick.get("role") or "").lower() or None
-        dmg_type = (pick.get("damage_type") or "").lower() or None
-        tags = [str(t).lower() for t in (pick.get("tags") or []) if t]
-    else:
-        champ_name = str(pick)
-        role = None
-        dmg_type = None
-        tags = []
-
-    champ_key = str(champ_name).strip()
-    meta = CHAMPION_METADATA.get(champ_key.lower())
-
-    if meta:
-        if role is None and meta.default_role:
-            role = meta.default_role
-        if dmg_type is None and meta.damage_type:
-            dmg_type = meta.damage_type
-        for t in meta.tags:
-            lt = t.lower()
-            if lt not in tags:
-                tags.append(lt)
+        role = _canonical_token(pick.get("role") or "") or None
+        dmg_type = _canonical_token(pick.get("damage_type") or "") or None
+        tags = tuple(_canonical_token(str(t)) for t in (pick.get("tags") or []) if t)
+        return (str(champ_name).strip(), role, dmg_type, tags)
+    return (str(pick).strip(), None, None, ())
+
+
+def _normalize_pick(key: PickKey) -> Dict[str, Any]:
+    """Normalize a canonical pick key into a standard dict, filling gaps from champion metadata."""
+    champ_key, role, dmg_type, key_tags = key
+    tags = list(key_tags)
+    idx = CHAMP_ID.get(champ_key)
+    if idx is None:
+        idx = CHAMP_ID.get(champ_key.lower())
+
+    if idx is not None:
+        if role is None:
+            role = CHAMP_ROLES[idx]
+        if dmg_type is None:
+            dmg_type = CHAMP_DAMAGE[idx]
+        if not tags:
+            tags.extend(CHAMP_TAGS[idx])
+        else:
+            present = frozenset(tags)
+            tags.extend(t for t in CHAMP_TAGS[idx] if t not in present)
 
     return {
         "champion": champ_key,
@@ -121,28 +193,21 @@ def _normalize_pick(pick: Any) -> Dict[str, Any]:
 def _apply_fallback_for_unknowns(picks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Fill role, damage_type, and tags for picks that have none (unknown champions).
     Ensures non-zero synergy, role coverage, and damage composition scores.
+    Picks are freshly built by _normalize_pick, so they are updated in place.
     """
-    result: List[Dict[str, Any]] = []
+    n_default = len(DEFAULT_ROLE_BY_INDEX)
     for i, p in enumerate(picks):
-        out = dict(p)
-        role = (out.get("role") or "").strip()
-        dmg_type = (out.get("damage_type") or "").strip()
-        tags = list(out.get("tags") or [])
-
-        idx = i % len(DEFAULT_ROLE_BY_INDEX)
-        if not role:
-            out["role"] = DEFAULT_ROLE_BY_INDEX[idx]
-            role = out["role"]
-        if not dmg_type:
-            out["damage_type"] = "mixed"
-            dmg_type = "mixed"
-        if not tags:
-            if role in ("top", "jungle"):
-                out["tags"] = ["frontline", "engage"]
-            else:
-                out["tags"] = ["carry", "dps"]
-        result.append(out)
-    return result
+        role = p["role"]
+        if not role or not role.strip():
+            role = p["role"] = DEFAULT_ROLE_BY_INDEX[i % n_default]
+        else:
+            role = role.strip()
+        dmg_type = p["damage_type"]
+        if not dmg_type or not dmg_type.strip():
+            p["damage_type"] = "mixed"
+        if not p["tags"]:
+            p["tags"] = ["frontline", "engage"] if role in ("top", "jungle") else ["carry", "dps"]
+    return picks
 
 
 def _synergy_score(picks: List[Dict[str, Any]], roles: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -150,10 +215,8 @@ def _synergy_score(picks: List[Dict[str, Any]], roles: Dict[str, Any] | None = N
     if not picks:
         return {"score": 0.0, "classification": "unknown", "details": {}}
 
-    tag_counts: Dict[str, int] = {}
-    for p in picks:
-        for t in p.get("tags") or []:
-            tag_counts[t] = tag_counts.get(t, 0) + 1
+    tag_counts: Dict[str, int] = dict(Counter(chain.from_iterable(p.get("tags") or () for p in picks)))
+    all_tags = tag_counts.keys()
 
     # Base score for having a full comp (5 roles) – ensures non-zero when draft is filled
     role_score = 0.0
@@ -163,8 +226,8 @@ def _synergy_score(picks: List[Dict[str, Any]], roles: Dict[str, Any] | None = N
         role_score = 15.0
 
     # Frontline + carry balance (core comp synergy)
-    has_frontline = any(t in p.get("tags", []) for p in picks for t in ("tank", "frontline"))
-    has_carry = any(t in p.get("tags", []) for p in picks for t in ("hyper_carry", "carry", "dps"))
+    has_frontline = not FRONTLINE_TAGS.isdisjoint(all_tags)
+    has_carry = not CARRY_TAGS.isdisjoint(all_tags)
     core_score = 25.0 if (has_frontline and has_carry) else (10.0 if (has_frontline or has_carry) else 0.0)
 
     # Shared synergy tags (engage, teamfight, pick, aoe, scaling)
@@ -178,12 +241,7 @@ def _synergy_score(picks: List[Dict[str, Any]], roles: Dict[str, Any] | None = N
             shared_score += 2.0
 
     raw_score = min(100.0, role_score + core_score + shared_score)
-    if raw_score >= 70:
-        label = "high"
-    elif raw_score >= 40:
-        label = "medium"
-    else:
-        label = "low"
+    label = SYNERGY_LABELS[(raw_score >= 40) + (raw_score >= 70)]
 
     return {
         "score": round(raw_score, 2),
@@ -200,17 +258,7 @@ def _damage_balance(picks: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Evaluate physical vs magic damage mix and return a balance score."""
     counts = {"physical": 0, "magic": 0, "mixed": 0, "true": 0, "unknown": 0}
     for p in picks:
-        dt = (p.get("damage_type") or "").lower()
-        if dt in ("physical", "ad"):
-            counts["physical"] += 1
-        elif dt in ("magic", "ap"):
-            counts["magic"] += 1
-        elif dt in ("mixed",):
-            counts["mixed"] += 1
-        elif dt in ("true",):
-            counts["true"] += 1
-        else:
-            counts["unknown"] += 1
+        counts[DAMAGE_TYPE_BUCKETS.get(p.get("damage_type"), "unknown")] += 1
 
     total_known = counts["physical"] + counts["magic"] + counts["mixed"]
     if total_known == 0:
@@ -227,12 +275,7 @@ def _damage_balance(picks: List[Dict[str, Any]]) -> Dict[str, Any]:
     skew = abs(phys_ratio - magic_ratio)
     score = max(0.0, 100.0 * (1.0 - skew))
 
-    if score >= 70:
-        label = "balanced"
-    elif score >= 40:
-        label = "leaning"
-    else:
-        label = "one_dimensional"
+    label = DAMAGE_BALANCE_LABELS[(score >= 40) + (score >= 70)]
 
     return {
         "score": round(score, 2),
@@ -243,21 +286,14 @@ def _damage_balance(picks: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 def _role_coverage(picks: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Check whether standard roles are covered."""
-    roles_present = {r: 0 for r in REQUIRED_ROLES}
-    for p in picks:
-        r = (p.get("role") or "").lower()
-        if r in roles_present:
-            roles_present[r] += 1
+    role_counts = Counter(p.get("role") for p in picks)
+    # Keep REQUIRED_ROLES order for roles_present / missing / duplicates
+    roles_present = {r: role_counts[r] for r in REQUIRED_ROLES}
 
-    missing = [r for r, c in roles_present.items() if c == 0]
-    duplicates = [r for r, c in roles_present.items() if c > 1]
+    missing = [r for r in REQUIRED_ROLES if not roles_present[r]]
+    duplicates = [r for r in REQUIRED_ROLES if roles_present[r] > 1]
 
-    if not missing and not duplicates:
-        status = "complete"
-    elif not missing and duplicates:
-        status = "overlapping"
-    else:
-        status = "incomplete"
+    status = ROLE_COVERAGE_STATUS[(bool(missing) << 1) | bool(duplicates)]
 
     return {
         "status": status,
@@ -337,8 +373,55 @@ def evaluate_draft(draft_list: List[Any]) -> Dict[str, Any]:
           "risk_alerts": [ { "severity", "type", "message" }, ... ],
           "picks": [normalized_picks...],
         }
+
+        Evaluations are memoized per canonical draft; each call returns its own
+        copy, so callers may mutate the result.
+    """
+    key = tuple(_pick_key(p) for p in draft_list) if draft_list else ()
+    return _copy_result(_evaluate_draft_cached(key))
+
+
+def evaluate_drafts_batch(drafts: List[List[Any]]) -> List[Dict[str, Any]]:
+    """Evaluate many drafts at once (e.g. candidate drafts from a suggestion search).
+
+    Drafts are reduced to canonical keys first, so repeated drafts within the
+    batch (or seen in earlier calls) are evaluated only once.
+
+    Args:
+        drafts: List of drafts, each a list of champion picks (strings or dicts).
+
+    Returns:
+        List of evaluate_draft() results (each a fresh copy), in the same order as `drafts`.
     """
-    raw_picks = [_normalize_pick(p) for p in draft_list or []]
+    return [evaluate_draft(draft) for draft in drafts or []]
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an evaluation down to its innermost dicts/lists (several times cheaper than deepcopy)."""
+    synergy = result["synergy"]
+    damage = result["damage_composition"]
+    roles = result["role_coverage"]
+    return {
+        "synergy": {
+            **synergy,
+            "details": {k: v.copy() if isinstance(v, dict) else v for k, v in synergy["details"].items()},
+        },
+        "damage_composition": {**damage, "details": damage["details"].copy()},
+        "role_coverage": {
+            "status": roles["status"],
+            "missing_roles": roles["missing_roles"].copy(),
+            "duplicate_roles": roles["duplicate_roles"].copy(),
+            "roles_present": roles["roles_present"].copy(),
+        },
+        "risk_alerts": [a.copy() for a in result["risk_alerts"]],
+        "picks": [{**p, "tags": p["tags"].copy()} for p in result["picks"]],
+    }
+
+
+@lru_cache(maxsize=1024)
+def _evaluate_draft_cached(key: Tuple[PickKey, ...]) -> Dict[str, Any]:
+    """Evaluate a draft given its canonical pick keys. Cached and private: callers get _copy_result()."""
+    raw_picks = [_normalize_pick(k) for k in key]
     picks = _apply_fallback_for_unknowns(raw_picks)
 
     roles = _role_coverage(picks)
@@ -353,4 +436,3 @@ def evaluate_draft(draft_list: List[Any]) -> Dict[str, Any]:
         "risk_alerts": alerts,
         "picks": picks,
     }
-
@@ -1,11 +1,17 @@
 """GRID GraphQL client for Coach Command Center."""
 
-import json
+import asyncio
+import copy
+import importlib.util
 import logging
 import os
+from functools import lru_cache
 from typing import Any
 
-import requests
+import httpx
+
+from app.json_utils import dumps, dumps_bytes, loads
+from app.ttl_cache import TTLCache
 
 # GRID GraphQL endpoint (central data API)
 GRID_GRAPHQL_URL = "https://api-op.grid.gg/central-data/graphql"
@@ -13,18 +19,164 @@ GRID_GRAPHQL_URL = "https://api-op.grid.gg/central-data/graphql"
 # Header key used by GRID for API auth
 GRID_API_KEY_HEADER = "x-api-key"
 
+# GraphQL documents (module-level so they are built once)
+TEAM_LOOKUP_QUERY = """
+query TeamId($teamName: String!) {
+  teams(filter: { name: { contains: $teamName } }, first: 5) {
+    edges {
+      node {
+        id
+        name
+      }
+    }
+  }
+}
+"""
+
+TEAM_LOOKUP_WITH_ALTERNATE_QUERY = """
+query TeamIdWithAlternate($teamName: String!, $altName: String!) {
+  primary: teams(filter: { name: { contains: $teamName } }, first: 5) {
+    edges {
+      node {
+        id
+        name
+      }
+    }
+  }
+  alternate: teams(filter: { name: { contains: $altName } }, first: 5) {
+    edges {
+      node {
+        id
+        name
+      }
+    }
+  }
+}
+"""
+
+# The selection set is the projection: only the node fields the parser/analyzers read are
+# requested, which keeps allSeries bodies small enough to decode in one orjson call even
+# at match_limit=50. Add fields here only when something consumes them.
+TEAM_SERIES_QUERY = """
+query TeamSeries($teamIds: IdFilter!, $first: Int!) {
+  allSeries(filter: { teamIds: $teamIds }, first: $first) {
+    edges {
+      node {
+        id
+        title { name }
+        startTimeScheduled
+        type
+      }
+    }
+  }
+}
+"""
+
 logger = logging.getLogger("coach_command_center.grid_client")
 
+# In-process TTL caches (seconds). Team ids by name are effectively static; series lists change slowly.
+GRID_TEAM_CACHE_TTL = float(os.environ.get("GRID_TEAM_CACHE_TTL") or 86400)
+GRID_SERIES_CACHE_TTL = float(os.environ.get("GRID_SERIES_CACHE_TTL") or 300)
+
+# Retries for transient GRID failures (5xx, 429, dropped connections); connect errors are
+# already retried by the transport. Delay is GRID_RETRY_BACKOFF * 2**attempt unless the
+# response carries a numeric Retry-After (capped at _RETRY_MAX_DELAY).
+GRID_RETRY_ATTEMPTS = int(os.environ.get("GRID_RETRY_ATTEMPTS") or 3)
+GRID_RETRY_BACKOFF = float(os.environ.get("GRID_RETRY_BACKOFF") or 0.3)
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_RETRY_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
+_RETRY_MAX_DELAY = 5.0
+
+# HTTP/2 (one multiplexed connection to GRID) needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: httpx.AsyncClient | None = None
+
+
+# team_name.lower() -> (team_node, team_id); only successful resolutions are cached
+_TEAM_CACHE = TTLCache(GRID_TEAM_CACHE_TTL, maxsize=512)
+# (team_id, first) -> raw allSeries response (callers get deep copies)
+_SERIES_CACHE = TTLCache(GRID_SERIES_CACHE_TTL, maxsize=256)
+# team_name.lower() -> consecutive lookups that ended with 0 series; at _EMPTY_STREAK_LIMIT the
+# GRID round-trips are skipped until the entry expires (or force_refresh is used)
+_EMPTY_TEAM_STREAK = TTLCache(GRID_SERIES_CACHE_TTL, maxsize=512)
+_EMPTY_STREAK_LIMIT = 2
+# (team_name.lower(), match_limit, force_refresh) -> in-flight fetch shared by concurrent callers
+_INFLIGHT: dict[tuple[str, int, bool], asyncio.Task[dict[str, Any]]] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared pooled (HTTP/2 when available) async client for GRID, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        # Pool settings must be given to the transport: httpx ignores client-level limits/http2
+        # when an explicit transport is passed.
+        _client = httpx.AsyncClient(
+            timeout=30,
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=_HTTP2_AVAILABLE,
+            ),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared GRID client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def _get_api_key() -> str | None:
     """Read GRID API key from environment."""
     return os.environ.get("GRID_API_KEY")
 
 
-def _graphql_request(query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+def _retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """Backoff before retry number attempt (0-based), honouring a numeric Retry-After header."""
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    return min(GRID_RETRY_BACKOFF * (2 ** attempt), _RETRY_MAX_DELAY)
+
+
+async def _post_with_retry(content: bytes, headers: dict[str, str]) -> httpx.Response:
+    """POST to GRID, retrying transient statuses and connection drops (GraphQL queries are idempotent)."""
+    client = _get_client()
+    for attempt in range(GRID_RETRY_ATTEMPTS + 1):
+        last_try = attempt == GRID_RETRY_ATTEMPTS
+        try:
+            response = await client.post(GRID_GRAPHQL_URL, content=content, headers=headers)
+        except _RETRY_ERRORS as exc:
+            if last_try:
+                raise
+            logger.info({"event": "grid_retry", "attempt": attempt + 1, "error": type(exc).__name__})
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+        if response.status_code not in _RETRY_STATUSES or last_try:
+            return response
+        logger.info({"event": "grid_retry", "attempt": attempt + 1, "status": response.status_code})
+        await asyncio.sleep(_retry_delay(attempt, response))
+    raise AssertionError("unreachable")
+
+
+@lru_cache(maxsize=4)
+def _grid_headers(api_key: str) -> dict[str, str]:
+    """Return the (reused) request headers for a GRID API key."""
+    return {"Content-Type": "application/json", GRID_API_KEY_HEADER: api_key}
+
+
+async def _graphql_request(query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
     """
     Send a GraphQL POST request to GRID and return the raw JSON response.
-    Raises ValueError if GRID_API_KEY is not set. Raises on HTTP/request errors.
+    Raises ValueError if GRID_API_KEY is not set. Raises on HTTP/request errors
+    (after GRID_RETRY_ATTEMPTS retries for transient failures).
     """
     api_key = _get_api_key()
     if not api_key:
@@ -34,29 +186,24 @@ def _graphql_request(query: str, variables: dict[str, Any] | None = None) -> dic
     if variables:
         payload["variables"] = variables
 
-    logger.debug(
-        {"event": "grid_request", "query_preview": query.strip()[:200], "variables": variables}
-    )
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(
+            {"event": "grid_request", "query_preview": query.strip()[:200], "variables": variables}
+        )
 
-    response = requests.post(
-        GRID_GRAPHQL_URL,
-        json=payload,
-        headers={
-            "Content-Type": "application/json",
-            GRID_API_KEY_HEADER: api_key,
-        },
-        timeout=30,
-    )
+    response = await _post_with_retry(dumps_bytes(payload), _grid_headers(api_key))
     response.raise_for_status()
-    raw = response.json()
+    raw = loads(response.content)
 
-    # Debug: log full raw JSON (truncate if huge)
-    raw_str = json.dumps(raw, default=str)
-    if len(raw_str) > 4000:
-        logger.debug({"event": "grid_raw_response", "truncated": True, "length": len(raw_str)})
-        logger.debug({"event": "grid_raw_response_sample", "body": raw_str[:4000] + "..."})
-    else:
-        logger.debug({"event": "grid_raw_response", "body": raw_str})
+    # Debug: log full raw JSON (truncate if huge). Only serialize when DEBUG is enabled.
+    if debug:
+        raw_str = dumps(raw)
+        if len(raw_str) > 4000:
+            logger.debug({"event": "grid_raw_response", "truncated": True, "length": len(raw_str)})
+            logger.debug({"event": "grid_raw_response_sample", "body": raw_str[:4000] + "..."})
+        else:
+            logger.debug({"event": "grid_raw_response", "body": raw_str})
 
     if raw.get("errors"):
         logger.warning({"event": "grid_errors", "errors": raw.get("errors")})
@@ -64,36 +211,62 @@ def _graphql_request(query: str, variables: dict[str, Any] | None = None) -> dic
     return raw
 
 
-def _team_lookup(team_name: str) -> tuple[dict[str, Any] | None, str | None]:
+async def _team_lookup(
+    team_name: str, use_cache: bool = True
+) -> tuple[dict[str, Any] | None, str | None, bool]:
     """
-    Resolve team id by name. Returns (team_node, team_id) or (None, None) if not found.
+    Resolve team id by name. Returns (team_node, team_id, errored); (None, None, ...) if not found.
+    errored is True when the lookup response carried GraphQL errors (never for a cache hit).
     """
-    team_query = """
-    query TeamId($teamName: String!) {
-      teams(filter: { name: { contains: $teamName } }, first: 5) {
-        edges {
-          node {
-            id
-            name
-          }
-        }
-      }
-    }
+    cached = _TEAM_CACHE.get(team_name.lower()) if use_cache else None
+    if cached is not None:
+        return (*cached, False)
+    team_resp = await _graphql_request(TEAM_LOOKUP_QUERY, {"teamName": team_name})
+    return (*_cache_team(team_name, _resolve_team(team_name, team_resp, "teams")), bool(team_resp.get("errors")))
+
+
+async def _team_lookup_with_alternate(
+    team_name: str, alt_name: str
+) -> tuple[tuple[dict[str, Any] | None, str | None, bool], tuple[dict[str, Any] | None, str | None, bool]]:
     """
-    team_resp = _graphql_request(team_query, {"teamName": team_name})
+    Resolve team_name and alt_name in one GraphQL request (aliased `teams` fields), bypassing
+    the team cache; both results are re-cached. Returns ((team_node, team_id, errored),
+    (alt_node, alt_id, errored)); see _team_lookup.
+    """
+    teams_resp = await _graphql_request(TEAM_LOOKUP_WITH_ALTERNATE_QUERY, {"teamName": team_name, "altName": alt_name})
+    errored = bool(teams_resp.get("errors"))
+    return (
+        (*_cache_team(team_name, _resolve_team(team_name, teams_resp, "primary")), errored),
+        (*_cache_team(alt_name, _resolve_team(alt_name, teams_resp, "alternate")), errored),
+    )
+
+
+def _cache_team(
+    team_name: str, resolved: tuple[dict[str, Any] | None, str | None]
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Store a successful (team_node, team_id) resolution in the team cache and return it."""
+    if resolved[1]:
+        _TEAM_CACHE.set(team_name.lower(), resolved)
+    return resolved
+
+
+def _resolve_team(
+    team_name: str, team_resp: dict[str, Any], field: str
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Pick the best team node for team_name from data.<field>.edges of a teams query response."""
+    data = team_resp.get("data") or {}
+    edges = (data.get(field) or {}).get("edges") or []
     logger.info(
         {
             "event": "grid_team_lookup",
             "team_name": team_name,
-            "raw_data_keys": list((team_resp.get("data") or {}).keys()),
-            "raw_teams_edges_count": len(
-                (team_resp.get("data") or {}).get("teams", {}).get("edges", [])
-            ),
+            "raw_data_keys": list(data.keys()),
+            "raw_teams_edges_count": len(edges),
         }
     )
-    logger.debug({"event": "grid_team_lookup_raw", "response": team_resp})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug({"event": "grid_team_lookup_raw", "response": team_resp})
 
-    edges = (team_resp.get("data") or {}).get("teams", {}).get("edges", [])
     if not edges:
         logger.warning({"event": "grid_team_not_found", "team_name": team_name})
         return None, None
@@ -122,26 +295,16 @@ def _team_lookup(team_name: str) -> tuple[dict[str, Any] | None, str | None]:
     return team_node, team_id
 
 
-def _series_for_team(team_id: str, first: int) -> dict[str, Any]:
-    """
-    Fetch allSeries for a single team id. Returns raw GraphQL response.
+async def _series_for_team(team_id: str, first: int, use_cache: bool = True) -> dict[str, Any]:
     """
-    series_query = """
-    query TeamSeries($teamIds: IdFilter!, $first: Int!) {
-      allSeries(filter: { teamIds: $teamIds }, first: $first) {
-        edges {
-          node {
-            id
-            title { name }
-            startTimeScheduled
-            type
-          }
-        }
-      }
-    }
+    Fetch allSeries for a single team id. Returns raw GraphQL response (a private copy
+    when served from or stored in the series cache, so callers may mutate it).
     """
+    cached = _SERIES_CACHE.get((team_id, first)) if use_cache else None
+    if cached is not None:
+        return copy.deepcopy(cached)
     variables = {"teamIds": {"in": [team_id]}, "first": first}
-    series_resp = _graphql_request(series_query, variables)
+    series_resp = await _graphql_request(TEAM_SERIES_QUERY, variables)
 
     data = series_resp.get("data") or {}
     all_series = data.get("allSeries") or {}
@@ -157,11 +320,33 @@ def _series_for_team(team_id: str, first: int) -> dict[str, Any]:
             "allSeries_type": type(all_series).__name__,
         }
     )
-    logger.debug({"event": "grid_series_raw", "response": series_resp})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug({"event": "grid_series_raw", "response": series_resp})
 
+    if not series_resp.get("errors"):
+        _SERIES_CACHE.set((team_id, first), series_resp)
+        return copy.deepcopy(series_resp)
     return series_resp
 
 
+def _empty_series_response(skipped: str) -> dict[str, Any]:
+    """Return the empty fetch_team_matches() shape for a lookup that was not sent to GRID."""
+    return {"data": {"allSeries": {"edges": []}}, "team": None, "_skipped": skipped}
+
+
+def _record_empty_result(team_key: str, empty: bool, errored: bool = False) -> None:
+    """Track consecutive 0-series results for a team name (a non-empty result resets it).
+
+    Responses that carried GraphQL errors are not counted: the failure may be transient.
+    """
+    if errored:
+        return
+    if empty:
+        _EMPTY_TEAM_STREAK.set(team_key, (_EMPTY_TEAM_STREAK.get(team_key) or 0) + 1)
+    else:
+        _EMPTY_TEAM_STREAK.set(team_key, 0)
+
+
 def _extract_series_edges(raw: dict[str, Any]) -> list[dict[str, Any]]:
     """
     Extract series/match edges from GRID response. Handles data.allSeries.edges.
@@ -181,17 +366,25 @@ def _extract_series_edges(raw: dict[str, Any]) -> list[dict[str, Any]]:
     return edges
 
 
-def fetch_team_matches(team_name: str, match_limit: int) -> dict[str, Any]:
+async def fetch_team_matches(team_name: str, match_limit: int, force_refresh: bool = False) -> dict[str, Any]:
     """
     Fetch matches (series) for a team from the GRID GraphQL API.
 
     Resolves team by name, then queries allSeries with teamIds filter.
     Returns raw JSON; use parse_match_data() on each series node for structured data.
-    Tries alternate name (e.g. "Liquid" if "Team Liquid" returns 0 series) to improve results.
+    Team ids and series responses are cached in-process (GRID_TEAM_CACHE_TTL /
+    GRID_SERIES_CACHE_TTL seconds), and concurrent calls for the same team/limit share one
+    in-flight fetch (each extra caller gets its own copy of the result).
+    Tries alternate name (e.g. "Liquid" if "Team Liquid" returns 0 series) to improve results;
+    when the primary name is not cached, the alternate-name lookup is batched into the same
+    GraphQL request as the primary one; otherwise it is sent only if the primary has 0 series.
+    Names shorter than 2 characters, and names that returned 0 series twice in a row, are
+    answered with an empty result (marked with "_skipped") without calling GRID.
 
     Args:
         team_name: Team name to search for (used in a name filter).
         match_limit: Maximum number of series/matches to return.
+        force_refresh: Bypass the in-process team/series/empty-result caches (results are re-cached).
 
     Returns:
         Raw JSON response from GRID (data and/or errors). Callers should read
@@ -199,31 +392,74 @@ def fetch_team_matches(team_name: str, match_limit: int) -> dict[str, Any]:
 
     Raises:
         ValueError: If GRID_API_KEY is not set.
-        requests.RequestException: On HTTP or connection errors.
+        httpx.HTTPError: On HTTP or connection errors.
     """
-    # 1) Resolve team id by name (try given name first)
-    team_node, team_id = _team_lookup(team_name)
+    key = ((team_name or "").strip().lower(), match_limit, force_refresh)
+    task = _INFLIGHT.get(key)
+    if task is not None:
+        return copy.deepcopy(await asyncio.shield(task))
+
+    task = asyncio.create_task(_fetch_team_matches(team_name, match_limit, force_refresh))
+    _INFLIGHT[key] = task
+
+    def _done(_: asyncio.Task[dict[str, Any]]) -> None:
+        if _INFLIGHT.get(key) is task:
+            del _INFLIGHT[key]
+
+    task.add_done_callback(_done)
+    return await asyncio.shield(task)
+
+
+async def _fetch_team_matches(team_name: str, match_limit: int, force_refresh: bool) -> dict[str, Any]:
+    """Uncoalesced fetch_team_matches() body; see that function for behaviour."""
+    # 0) Skip GRID entirely for names that cannot match, or that came back empty repeatedly
+    team_name = (team_name or "").strip()
+    if len(team_name) < 2:
+        logger.info({"event": "fetch_team_matches", "matches_analyzed": 0, "reason": "invalid_team_name"})
+        return _empty_series_response("invalid_team_name")
+    team_key = team_name.lower()
+    if not force_refresh and (_EMPTY_TEAM_STREAK.get(team_key) or 0) >= _EMPTY_STREAK_LIMIT:
+        logger.info({"event": "fetch_team_matches", "matches_analyzed": 0, "reason": "known_empty_team"})
+        return _empty_series_response("known_empty_team")
+
+    # 1) Resolve team id by name, from the team cache first. On a miss, multi-word names also
+    #    resolve the alternate name (e.g. "Liquid" for "Team Liquid") in the same GraphQL
+    #    request; it is only used if step 3 needs it.
+    alt_name = team_name.split()[-1] if " " in team_name else None
+    if alt_name == team_name:
+        alt_name = None
+    alt_lookup: tuple[dict[str, Any] | None, str | None, bool] | None = None
+    cached_team = None if force_refresh else _TEAM_CACHE.get(team_key)
+    if cached_team is not None:
+        team_node, team_id = cached_team
+        lookup_errored = False
+    elif alt_name:
+        (team_node, team_id, lookup_errored), alt_lookup = await _team_lookup_with_alternate(team_name, alt_name)
+    else:
+        team_node, team_id, lookup_errored = await _team_lookup(team_name, use_cache=not force_refresh)
     if not team_id:
+        _record_empty_result(team_key, True, lookup_errored)
         out = {"data": {"allSeries": {"edges": []}}, "team": team_node}
         logger.info({"event": "fetch_team_matches", "matches_analyzed": 0, "reason": "no_team_id"})
         return out
 
     # 2) Fetch series for this team
-    series_resp = _series_for_team(team_id, match_limit)
+    series_resp = await _series_for_team(team_id, match_limit, use_cache=not force_refresh)
     edges = _extract_series_edges(series_resp)
 
-    # 3) If 0 series, try alternate team name (e.g. "Liquid" for "Team Liquid")
-    if len(edges) == 0 and " " in team_name.strip():
-        alt_name = team_name.strip().split()[-1]
-        if alt_name != team_name:
-            logger.info({"event": "grid_try_alternate_name", "alt_name": alt_name})
-            team_node_alt, team_id_alt = _team_lookup(alt_name)
-            if team_id_alt:
-                series_resp = _series_for_team(team_id_alt, match_limit)
-                edges = _extract_series_edges(series_resp)
-                if edges:
-                    series_resp.setdefault("team", team_node_alt)
-                    team_node = team_node_alt
+    # 3) If 0 series, try alternate team name (e.g. "Liquid" for "Team Liquid"); it is only
+    #    looked up here when the primary came from the cache
+    if len(edges) == 0 and alt_name:
+        logger.info({"event": "grid_try_alternate_name", "alt_name": alt_name})
+        if alt_lookup is None:
+            alt_lookup = await _team_lookup(alt_name, use_cache=not force_refresh)
+        team_node_alt, team_id_alt, _ = alt_lookup
+        if team_id_alt:
+            series_resp = await _series_for_team(team_id_alt, match_limit, use_cache=not force_refresh)
+            edges = _extract_series_edges(series_resp)
+            if edges:
+                series_resp.setdefault("team", team_node_alt)
+                team_node = team_node_alt
 
     # 4) Optional demo fallback: if still 0 series (e.g. Team Liquid has no series in this GRID product),
     #    retry with GRID_DEMO_FALLBACK_TEAM (e.g. "G2") so tests can get matches_analyzed >= 1.
@@ -237,9 +473,9 @@ def fetch_team_matches(team_name: str, match_limit: int) -> dict[str, Any]:
                 "reason": "0 series for requested team; using fallback for demo.",
             }
         )
-        team_node_fb, team_id_fb = _team_lookup(_demo_fallback)
+        team_node_fb, team_id_fb, _ = await _team_lookup(_demo_fallback, use_cache=not force_refresh)
         if team_id_fb:
-            series_resp = _series_for_team(team_id_fb, match_limit)
+            series_resp = await _series_for_team(team_id_fb, match_limit, use_cache=not force_refresh)
             edges = _extract_series_edges(series_resp)
             if edges:
                 series_resp.setdefault("team", team_node_fb)
@@ -254,15 +490,20 @@ def fetch_team_matches(team_name: str, match_limit: int) -> dict[str, Any]:
     else:
         series_resp["data"]["allSeries"]["edges"] = edges
     series_resp.setdefault("team", team_node)
+    _record_empty_result(team_key, not edges, bool(series_resp.get("errors")))
 
-    # Debug: print raw JSON (summary) to stdout when no matches so devs can inspect
-    if len(edges) == 0:
-        import sys
-        print("[GRID DEBUG] fetch_team_matches: 0 series returned.", file=sys.stderr)
-        print("[GRID DEBUG] team_name=%r team_id=%r team_node=%s" % (team_name, team_id, team_node), file=sys.stderr)
-        print("[GRID DEBUG] series_response_keys=%s" % (list(series_resp.keys()),), file=sys.stderr)
-        if series_resp.get("errors"):
-            print("[GRID DEBUG] errors=%s" % (series_resp["errors"],), file=sys.stderr)
+    # Debug: summarize the response when no matches so devs can inspect (DEBUG logging only)
+    if len(edges) == 0 and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            {
+                "event": "grid_zero_series",
+                "team_name": team_name,
+                "team_id": team_id,
+                "team_node": team_node,
+                "series_response_keys": list(series_resp.keys()),
+                "errors": series_resp.get("errors"),
+            }
+        )
 
     logger.info(
         {"event": "fetch_team_matches", "team_name": team_name, "matches_analyzed": len(edges)}
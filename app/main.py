@@ -1,52 +1,56 @@
 """Coach Command Center - FastAPI application entry point."""
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app import config  # noqa: F401 - load .env on startup
+from app import config  # first: loads .env before modules that read settings at import
+from app import chat_engine, grid_client
 from app.models import HealthResponse
-from app.routers import scouting_router, draft_router, chat_router
+from app.routers import scouting, scouting_router, draft_router, chat_router
 
 logger = logging.getLogger("coach_command_center")
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Start the optional analyzer process pool; close it and the shared HTTP clients on shutdown."""
+    scouting.start_executor()
+    yield
+    scouting.shutdown_executor()
+    await grid_client.aclose_client()
+    await chat_engine.aclose_client()
+
+
 app = FastAPI(
     title="Coach Command Center",
     description="Backend API for Coach Command Center",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
-# CORS: localhost for dev + CORS_ORIGINS from env for production (e.g. Vercel URL)
-_local_origins = [
-    "http://localhost:3000",
-    "http://127.0.0.1:3000",
-    "http://localhost:3001",
-    "http://127.0.0.1:3001",
-    "http://localhost:3002",
-    "http://127.0.0.1:3002",
-    "http://localhost:3003",
-    "http://127.0.0.1:3003",
-    "http://localhost:3004",
-    "http://127.0.0.1:3004",
-    "http://localhost:5173",
-    "http://127.0.0.1:5173",
-    "http://localhost:8080",
-    "http://127.0.0.1:8080",
-    "http://localhost:4200",
-    "http://127.0.0.1:4200",
-]
-_extra_origins = [o.strip() for o in (config.CORS_ORIGINS_EXTRA or "").split(",") if o.strip()]
-allow_origins = _local_origins + _extra_origins
+# CORS: localhost dev ports (matched by one regex) + CORS_ORIGINS from env for production
+# (e.g. Vercel URL), kept in a frozenset so per-request origin checks are O(1)
+LOCAL_ORIGIN_REGEX = r"http://(localhost|127\.0\.0\.1):(3000|3001|3002|3003|3004|5173|8080|4200)"
+allow_origins = frozenset(o.strip() for o in (config.CORS_ORIGINS_EXTRA or "").split(",") if o.strip())
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allow_origins,
+    allow_origin_regex=LOCAL_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Cache"],  # lets browser clients send If-None-Match / see report cache hits
 )
 
+# Compress JSON responses above 1 KB (scouting reports are typically tens of KB) for gzip-capable clients
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers (endpoints moved from main into router modules)
 app.include_router(scouting_router)  # POST /generate-scouting-report
 app.include_router(draft_router)     # POST /draft-risk-analysis
@@ -1,34 +1,75 @@
 """Parse raw match data into a clean structured dictionary."""
 
+from collections.abc import Iterator, Sequence
+from sys import intern
 from typing import Any
 
 
+# Alternative key names for each field (GraphQL camelCase, snake_case, other APIs)
+_MATCH_ID_KEYS = ("id", "matchId", "match_id")
+_CONTESTANTS_KEYS = ("contestants", "teams", "teamsList")
+_DRAFT_KEYS = ("draft", "draftPicks", "draft_picks", "picks")
+_PLAYER_STATS_KEYS = ("playerStats", "player_stats", "players", "members", "rosters")
+_OBJECTIVES_KEYS = ("objectives", "objectiveTimings", "objective_timings", "events")
+_KILL_PARTICIPATION_KEYS = ("killParticipation", "kill_participation", "kp")
+_WINNER_KEYS = ("winner", "winnerId", "winner_id")
+_LOSER_KEYS = ("loser", "loserId", "loser_id")
+_RESULT_KEYS = ("result", "outcome", "status")
+
+# Contestant result values meaning a win / a loss
+_WIN_RESULTS = frozenset(("win", "won", "victory", 1, "1"))
+_LOSS_RESULTS = frozenset(("loss", "lost", "defeat", 0, "0"))
+
+
 def _get_nested(
     data: dict[str, Any],
-    *keys: str,
+    keys: tuple[str, ...],
     default: Any = None,
 ) -> Any:
-    """Get value from nested dict using multiple possible key names."""
+    """Get the first non-None value from data among several possible key names."""
     if data is None or not isinstance(data, dict):
         return default
     for key in keys:
-        if key in data and data[key] is not None:
-            return data[key]
+        value = data.get(key)
+        if value is not None:
+            return value
     return default
 
 
+def _id(value: Any) -> Any:
+    """Intern string ids: they recur across every match and are used as dict keys by the analyzers."""
+    return intern(value) if type(value) is str else value
+
+
+def _pick(node: dict[str, Any], edge: dict[str, Any], *keys: str) -> Any:
+    """First non-None value for any of keys on a wrapped item's node, then on its edge (0 is kept)."""
+    for key in keys:
+        value = node.get(key)
+        if value is not None:
+            return value
+    for key in keys:
+        value = edge.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _iter_edges_nodes(value: Any) -> Iterator[Any]:
+    """Yield items from GraphQL-style edges/node or a direct list, without building a list."""
+    if isinstance(value, list):
+        yield from value
+    elif isinstance(value, dict):
+        edges = value.get("edges") or value.get("items") or []
+        if isinstance(edges, list):
+            for e in edges:
+                yield e.get("node", e) if isinstance(e, dict) else e
+
+
 def _edges_nodes(value: Any) -> list[Any]:
     """Extract list from GraphQL-style edges/node or direct list."""
-    if value is None:
-        return []
     if isinstance(value, list):
         return value
-    if isinstance(value, dict):
-        edges = value.get("edges") or value.get("items") or []
-        if isinstance(edges, list):
-            return [e.get("node", e) if isinstance(e, dict) else e for e in edges]
-        return []
-    return []
+    return list(_iter_edges_nodes(value))
 
 
 def parse_match_data(raw: dict[str, Any] | None) -> dict[str, Any]:
@@ -55,36 +96,42 @@ def parse_match_data(raw: dict[str, Any] | None) -> dict[str, Any]:
         return _empty_match_structure()
 
     # Unwrap GraphQL node if present (single match node from edges)
-    if isinstance(raw.get("node"), dict):
-        raw = raw["node"]
+    match raw:
+        case {"node": dict() as node}:
+            raw = node
 
-    match_id = _get_nested(raw, "id", "matchId", "match_id")
-    if match_id is None and isinstance(raw.get("match"), dict):
-        match_id = raw["match"].get("id") or raw["match"].get("matchId")
-    if match_id is None and isinstance(raw.get("match"), list) and raw["match"]:
-        first = raw["match"][0]
-        if isinstance(first, dict):
-            match_id = first.get("id") or first.get("matchId")
+    match_id = _get_nested(raw, _MATCH_ID_KEYS)
+    if match_id is None:
+        # Fall back to a nested match object, or the first one of a list of them
+        match raw.get("match"):
+            case (dict() as match_obj) | [dict() as match_obj, *_]:
+                match_id = match_obj.get("id") or match_obj.get("matchId")
 
     # Teams: contestants, teams, sides
     teams: list[dict[str, Any]] = []
-    contestants = _edges_nodes(_get_nested(raw, "contestants", "teams", "teamsList"))
+    contestants = _edges_nodes(_get_nested(raw, _CONTESTANTS_KEYS))
     for c in contestants:
         if not isinstance(c, dict):
             continue
         node_c = c.get("node", c)
         team = node_c.get("team", node_c) if isinstance(node_c, dict) else node_c
         if isinstance(team, dict):
+            side = node_c.get("side")
+            if side is None:
+                side = c.get("side")
+            score = node_c.get("score")
+            if score is None:
+                score = c.get("score")
             teams.append({
-                "id": team.get("id"),
+                "id": _id(team.get("id")),
                 "name": team.get("name") or team.get("slug"),
-                "side": node_c.get("side") or c.get("side") if isinstance(node_c, dict) else c.get("side"),
-                "score": node_c.get("score") or c.get("score") if isinstance(node_c, dict) else c.get("score"),
+                "side": side,
+                "score": score,
             })
         else:
             teams.append({"id": c.get("id"), "name": c.get("name"), "side": c.get("side"), "score": c.get("score")})
 
-    if not teams and _get_nested(raw, "teams"):
+    if not teams and raw.get("teams"):
         t = raw.get("teams") or raw.get("teamList")
         if isinstance(t, list):
             for t_item in t:
@@ -98,59 +145,127 @@ def parse_match_data(raw: dict[str, Any] | None) -> dict[str, Any]:
 
     # Draft picks
     draft_picks: list[dict[str, Any]] = []
-    drafts = _get_nested(raw, "draft", "draftPicks", "draft_picks", "picks")
+    drafts = _get_nested(raw, _DRAFT_KEYS)
     if isinstance(drafts, dict):
         drafts = drafts.get("picks") or drafts.get("selections") or _edges_nodes(drafts.get("edges"))
-    for item in _edges_nodes(drafts) if drafts is not None else []:
+    for item in _iter_edges_nodes(drafts):
         if not isinstance(item, dict):
             continue
-        node_item = item.get("node", item)
+        node_item = item.get("node")
+        if isinstance(node_item, dict):
+            # Wrapped pick: every alias on the node wins; edge-level fields only fill the gaps
+            pick_order = _pick(node_item, item, "order", "pickOrder")
+            team_id = _pick(node_item, item, "teamId", "team_id")
+            selection = _pick(node_item, item, "selection", "hero", "champion")
+            phase = _pick(node_item, item, "phase")
+        else:
+            # First non-None alias, so 0 (e.g. pick order 0) is kept
+            pick_order = item.get("order")
+            if pick_order is None:
+                pick_order = item.get("pickOrder")
+            team_id = item.get("teamId")
+            if team_id is None:
+                team_id = item.get("team_id")
+            selection = item.get("selection")
+            if selection is None:
+                selection = item.get("hero")
+                if selection is None:
+                    selection = item.get("champion")
+            phase = item.get("phase")
         draft_picks.append({
-            "pick_order": node_item.get("order") or node_item.get("pickOrder") or item.get("order"),
-            "team_id": node_item.get("teamId") or node_item.get("team_id") or item.get("teamId"),
-            "selection": node_item.get("selection") or node_item.get("hero") or node_item.get("champion") or item.get("selection"),
-            "phase": node_item.get("phase") or item.get("phase"),
+            "pick_order": pick_order,
+            "team_id": _id(team_id),
+            "selection": selection,
+            "phase": phase,
         })
 
     # Player stats
     player_stats: list[dict[str, Any]] = []
-    members_source = _get_nested(raw, "playerStats", "player_stats", "players", "members", "rosters")
-    for m in _edges_nodes(members_source) if members_source is not None else []:
+    members_source = _get_nested(raw, _PLAYER_STATS_KEYS)
+    for m in _iter_edges_nodes(members_source):
         if not isinstance(m, dict):
             continue
         node_m = m.get("node", m)
         player = node_m.get("player", node_m) if isinstance(node_m, dict) else node_m
         if isinstance(player, dict):
             stats = node_m if isinstance(node_m, dict) else m
+            get = stats.get
+            team_id = get("teamId")
+            if team_id is None:
+                team_id = get("team_id")
+                if team_id is None:
+                    team_id = player.get("teamId")
+                    if team_id is None:
+                        team_id = player.get("team_id")
+            # First non-None alias per stat, so a legitimate 0 is kept
+            kills = get("kills")
+            if kills is None:
+                kills = get("k")
+            deaths = get("deaths")
+            if deaths is None:
+                deaths = get("d")
+            assists = get("assists")
+            if assists is None:
+                assists = get("a")
+            damage = get("damage")
+            if damage is None:
+                damage = get("damageDealt")
+            gold = get("gold")
+            if gold is None:
+                gold = get("goldEarned")
+            cs = get("cs")
+            if cs is None:
+                cs = get("creepScore")
+                if cs is None:
+                    cs = get("minionsKilled")
             player_stats.append({
-                "player_id": player.get("id"),
+                "player_id": _id(player.get("id")),
                 "player_name": player.get("name") or player.get("nickname"),
-                "team_id": stats.get("teamId") or stats.get("team_id") or player.get("teamId"),
-                "kills": stats.get("kills") or stats.get("k"),
-                "deaths": stats.get("deaths") or stats.get("d"),
-                "assists": stats.get("assists") or stats.get("a"),
-                "damage": stats.get("damage") or stats.get("damageDealt"),
-                "gold": stats.get("gold") or stats.get("goldEarned"),
-                "cs": stats.get("cs") or stats.get("creepScore") or stats.get("minionsKilled"),
+                "team_id": _id(team_id),
+                "kills": kills,
+                "deaths": deaths,
+                "assists": assists,
+                "damage": damage,
+                "gold": gold,
+                "cs": cs,
             })
 
     # Objective timings (turrets, dragons, baron, etc.)
     objective_timings: list[dict[str, Any]] = []
-    objs = _get_nested(raw, "objectives", "objectiveTimings", "objective_timings", "events")
-    for o in _edges_nodes(objs) if objs is not None else []:
+    objs = _get_nested(raw, _OBJECTIVES_KEYS)
+    for o in _iter_edges_nodes(objs):
         if not isinstance(o, dict):
             continue
-        node_o = o.get("node", o)
+        node_o = o.get("node")
+        if isinstance(node_o, dict):
+            # Wrapped objective: every alias on the node wins; edge-level fields only fill the gaps
+            obj_type = _pick(node_o, o, "type", "objectiveType")
+            time_seconds = _pick(node_o, o, "time", "timeSeconds", "timestamp")
+            team_id = _pick(node_o, o, "teamId", "team_id")
+            position = _pick(node_o, o, "position")
+        else:
+            obj_type = o.get("type")
+            if obj_type is None:
+                obj_type = o.get("objectiveType")
+            time_seconds = o.get("time")
+            if time_seconds is None:
+                time_seconds = o.get("timeSeconds")
+                if time_seconds is None:
+                    time_seconds = o.get("timestamp")
+            team_id = o.get("teamId")
+            if team_id is None:
+                team_id = o.get("team_id")
+            position = o.get("position")
         objective_timings.append({
-            "type": node_o.get("type") or node_o.get("objectiveType") or o.get("type"),
-            "time_seconds": node_o.get("time") or node_o.get("timeSeconds") or node_o.get("timestamp") or o.get("time"),
-            "team_id": node_o.get("teamId") or node_o.get("team_id") or o.get("teamId"),
-            "position": node_o.get("position") or o.get("position"),
+            "type": obj_type,
+            "time_seconds": time_seconds,
+            "team_id": _id(team_id),
+            "position": position,
         })
 
     # Kill participation (per player or per team)
     kill_participation: dict[str, Any] = {}
-    kp = _get_nested(raw, "killParticipation", "kill_participation", "kp")
+    kp = _get_nested(raw, _KILL_PARTICIPATION_KEYS)
     if isinstance(kp, dict):
         kill_participation = {str(k): v for k, v in kp.items()}
     elif isinstance(kp, list):
@@ -162,9 +277,9 @@ def parse_match_data(raw: dict[str, Any] | None) -> dict[str, Any]:
 
     # Win/Loss
     win_loss: dict[str, Any] = {"winner": None, "loser": None, "winner_side": None, "result": None}
-    winner = _get_nested(raw, "winner", "winnerId", "winner_id")
-    loser = _get_nested(raw, "loser", "loserId", "loser_id")
-    result = _get_nested(raw, "result", "outcome", "status")
+    winner = _get_nested(raw, _WINNER_KEYS)
+    loser = _get_nested(raw, _LOSER_KEYS)
+    result = _get_nested(raw, _RESULT_KEYS)
     if result and isinstance(result, dict):
         winner = result.get("winner") or result.get("winnerId")
         loser = result.get("loser") or result.get("loserId")
@@ -173,11 +288,13 @@ def parse_match_data(raw: dict[str, Any] | None) -> dict[str, Any]:
             continue
         node_c = c.get("node", c)
         res = node_c.get("result") or node_c.get("outcome")
-        if res in ("win", "won", "victory", 1, "1"):
+        if not isinstance(res, (str, int, float)):
+            res = None  # unhashable (e.g. a nested result object) cannot be a set member
+        if res in _WIN_RESULTS:
             team_ref = node_c.get("teamId") or node_c.get("team")
             win_loss["winner"] = team_ref.get("id") if isinstance(team_ref, dict) else team_ref
             win_loss["winner_side"] = node_c.get("side")
-        elif res in ("loss", "lost", "defeat", 0, "0"):
+        elif res in _LOSS_RESULTS:
             team_ref = node_c.get("teamId") or node_c.get("team")
             win_loss["loser"] = team_ref.get("id") if isinstance(team_ref, dict) else team_ref
     if winner is not None:
@@ -198,8 +315,36 @@ def parse_match_data(raw: dict[str, Any] | None) -> dict[str, Any]:
     }
 
 
+def parse_match_batch(edges: Sequence[Any]) -> list[dict[str, Any]]:
+    """
+    Parse a list of GraphQL series edges ({"node": {...}}) in one pass.
+
+    Edges that are not dicts or have no node are skipped.
+
+    Args:
+        edges: e.g. data.allSeries.edges from a GRID response.
+
+    Returns:
+        List of parse_match_data() results, in edge order.
+    """
+    return parse_match_data_batch([node for edge in edges if isinstance(edge, dict) and (node := edge.get("node"))])
+
+
+def parse_match_data_batch(nodes: list[Any]) -> list[dict[str, Any]]:
+    """
+    Parse already-unwrapped series nodes, in order.
+
+    Args:
+        nodes: Series node dicts (edge["node"] values).
+
+    Returns:
+        List of parse_match_data() results, one per node.
+    """
+    return [parse_match_data({"node": node}) for node in nodes]
+
+
 def _empty_match_structure() -> dict[str, Any]:
-    """Return empty structure when input is missing."""
+    """Return empty structure when input is missing (fresh containers; callers may mutate it)."""
     return {
         "match_id": None,
         "teams": [],
@@ -1,6 +1,22 @@
 """Pydantic models for Coach Command Center."""
 
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bounds on request sizes, enforced at parse time so oversized bodies fail before any work
+MAX_MATCH_LIMIT = 50
+MAX_TEAM_NAME_LENGTH = 100
+MAX_DRAFT_SIZE = 10  # both teams' picks
+MAX_QUESTION_LENGTH = 4000
+
+# Shared by request bodies: unknown keys are dropped, bodies are immutable once parsed
+REQUEST_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_assignment=False,
+    str_strip_whitespace=True,
+    frozen=True,
+)
 
 
 class HealthResponse(BaseModel):
@@ -12,18 +28,42 @@ class HealthResponse(BaseModel):
 class ScoutingReportRequest(BaseModel):
     """Request body for POST /generate-scouting-report."""
 
-    team_name: str = Field(..., min_length=1, description="Team name to search for in GRID.")
-    match_limit: int = Field(..., ge=1, le=50, description="Max number of matches/series to fetch and analyze.")
+    model_config = REQUEST_MODEL_CONFIG
+
+    team_name: str = Field(
+        ..., min_length=1, max_length=MAX_TEAM_NAME_LENGTH, description="Team name to search for in GRID."
+    )
+    match_limit: int = Field(
+        ..., ge=1, le=MAX_MATCH_LIMIT, description="Max number of matches/series to fetch and analyze."
+    )
+    force_refresh: bool = Field(False, description="Bypass cached GRID team/series data and cached reports.")
+    mock_fallback: bool = Field(True, description="Analyze sample data when GRID returns no matches.")
 
 
 class DraftRiskRequest(BaseModel):
     """Request body for POST /draft-risk-analysis."""
 
-    draft: list[str] = Field(..., description="List of champion names to evaluate.")
+    model_config = REQUEST_MODEL_CONFIG
+
+    draft: list[str] = Field(..., max_length=MAX_DRAFT_SIZE, description="List of champion names to evaluate.")
+
+
+class DraftBatchRiskRequest(BaseModel):
+    """Request body for POST /draft-risk-analysis/batch."""
+
+    model_config = REQUEST_MODEL_CONFIG
+
+    drafts: list[Annotated[list[str], Field(max_length=MAX_DRAFT_SIZE)]] = Field(
+        ..., max_length=1000, description="Drafts to evaluate, each a list of champion names."
+    )
 
 
 class CoachChatRequest(BaseModel):
     """Request body for POST /coach-chat."""
 
-    question: str = Field(..., min_length=1, description="User question for the coach AI.")
-    scouting_report: dict = Field(default_factory=dict, description="Scouting report object for context.")
+    model_config = REQUEST_MODEL_CONFIG
+
+    question: str = Field(
+        ..., min_length=1, max_length=MAX_QUESTION_LENGTH, description="User question for the coach AI."
+    )
+    scouting_report: dict[str, Any] = Field(default_factory=dict, description="Scouting report object for context.")
@@ -5,6 +5,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
+from app.chat_engine import generate_chat_response_async
 from app.models import CoachChatRequest
 
 logger = logging.getLogger("coach_command_center")
@@ -13,13 +14,11 @@ router = APIRouter(tags=["chat"])
 
 
 @router.post("/coach-chat")
-def coach_chat(body: CoachChatRequest) -> dict[str, Any]:
+async def coach_chat(body: CoachChatRequest) -> dict[str, Any]:
     """
     Send a question and scouting report to the coach AI. Returns AI-generated
     response based on the scouting data (OpenAI or Gemini).
     """
-    from app.chat_engine import generate_chat_response
-
     logger.info(
         {
             "endpoint": "/coach-chat",
@@ -28,7 +27,7 @@ def coach_chat(body: CoachChatRequest) -> dict[str, Any]:
         }
     )
     try:
-        result = generate_chat_response(body.question, body.scouting_report)
+        result = await generate_chat_response_async(body.question, body.scouting_report)
         logger.info(
             {
                 "endpoint": "/coach-chat",
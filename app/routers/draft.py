@@ -5,7 +5,8 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
-from app.models import DraftRiskRequest
+from app.draft_engine import evaluate_draft, evaluate_drafts_batch
+from app.models import DraftBatchRiskRequest, DraftRiskRequest
 
 logger = logging.getLogger("coach_command_center")
 
@@ -18,8 +19,6 @@ def draft_risk_analysis(body: DraftRiskRequest) -> dict[str, Any]:
     Evaluate a draft (list of champion names) for synergy, damage balance,
     role coverage, and risk alerts. Returns draft_engine evaluation.
     """
-    from app.draft_engine import evaluate_draft
-
     logger.info(
         {
             "endpoint": "/draft-risk-analysis",
@@ -48,3 +47,39 @@ def draft_risk_analysis(body: DraftRiskRequest) -> dict[str, Any]:
         raise HTTPException(
             status_code=500, detail="Internal server error while evaluating draft."
         ) from exc
+
+
+@router.post("/draft-risk-analysis/batch")
+def draft_risk_analysis_batch(body: DraftBatchRiskRequest) -> dict[str, Any]:
+    """
+    Evaluate many drafts in one request (e.g. candidate drafts from a suggestion
+    tool). Returns {"results": [...]} with one draft_engine evaluation per draft.
+    """
+    logger.info(
+        {
+            "endpoint": "/draft-risk-analysis/batch",
+            "event": "request",
+            "drafts": len(body.drafts),
+        }
+    )
+    try:
+        results = evaluate_drafts_batch(body.drafts)
+        logger.info(
+            {
+                "endpoint": "/draft-risk-analysis/batch",
+                "event": "response",
+                "results": len(results),
+            }
+        )
+        return {"results": results}
+    except Exception as exc:
+        logger.exception(
+            {
+                "endpoint": "/draft-risk-analysis/batch",
+                "event": "error",
+                "error": str(exc),
+            }
+        )
+        raise HTTPException(
+            status_code=500, detail="Internal server error while evaluating drafts."
+        ) from exc
@@ -1,83 +1,159 @@
 """Scouting API routes (uses scouting_engine)."""
 
+import asyncio
+import copy
+import hashlib
 import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from app.grid_client import fetch_team_matches
+from app.json_utils import dumps_bytes
+from app.match_parser import parse_match_batch
+from app.mock_data import get_mock_match_data
 from app.models import ScoutingReportRequest
+from app.scouting_engine import (
+    analyze_team_compositions,
+    analyze_player_tendencies,
+    analyze_team_strategy,
+    generate_counter_strategies,
+)
+from app.ttl_cache import TTLCache
 
 logger = logging.getLogger("coach_command_center")
 
 router = APIRouter(tags=["scouting"])
 
+# Finished reports by (team_name.lower(), match_limit) -> (matches_analyzed, orjson-encoded body, ETag);
+# TTL 0 disables. Hits are sent as-is, skipping serialization. Mock-data reports are not cached.
+SCOUTING_REPORT_CACHE_TTL = float(os.environ.get("SCOUTING_REPORT_CACHE_TTL") or 300)
+_REPORT_CACHE = TTLCache(SCOUTING_REPORT_CACHE_TTL, maxsize=128)
+# (team_name.lower(), match_limit, force_refresh, mock_fallback) -> report build shared by concurrent callers
+_INFLIGHT: dict[tuple[str, int, bool, bool], asyncio.Task[tuple[int, bytes, str]]] = {}
 
-@router.post("/generate-scouting-report")
-def generate_scouting_report(body: ScoutingReportRequest) -> dict[str, Any]:
+# Worker processes for the analyzers (0 = threads in this process). Opt-in because process pools
+# need fork/semaphore support that serverless runtimes (e.g. the Lambda handler) lack.
+SCOUTING_PROCESS_WORKERS = int(os.environ.get("SCOUTING_PROCESS_WORKERS") or 0)
+_executor: ProcessPoolExecutor | None = None
+
+
+def start_executor() -> None:
+    """Create the analyzer process pool if SCOUTING_PROCESS_WORKERS > 0 (called on app startup)."""
+    global _executor
+    if SCOUTING_PROCESS_WORKERS > 0 and _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=SCOUTING_PROCESS_WORKERS)
+
+
+def shutdown_executor() -> None:
+    """Shut down the analyzer process pool (called on application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def _run_analyzer(
+    fn: Callable[[list[dict[str, Any]]], dict[str, Any]],
+    match_data_list: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Run one analyzer in the process pool when enabled, else in a worker thread."""
+    if _executor is not None:
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, match_data_list)
+    return await asyncio.to_thread(fn, match_data_list)
+
+
+def _etag(content: bytes) -> str:
+    """Weak ETag for an encoded report body: GZipMiddleware may send it gzip- or identity-encoded."""
+    return 'W/"%s"' % hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _report_response(request: Request, content: bytes, etag: str, cache_status: str) -> Response:
     """
-    Generate a combined scouting report for a team.
+    Send an encoded report, or 304 Not Modified when If-None-Match already has this ETag.
 
-    Fetches matches from GRID, parses them, runs scouting engines (team strategy,
-    player tendencies, team compositions), and counter strategy engine.
-    Returns combined JSON report.
+    cache_status ("hit"/"miss") is reported in the X-Cache header.
     """
-    from app.grid_client import fetch_team_matches
-    from app.match_parser import parse_match_data
-    from app.scouting_engine import (
-        analyze_team_compositions,
-        analyze_player_tendencies,
-        analyze_team_strategy,
-        generate_counter_strategies,
-    )
+    headers = {"ETag": etag, "X-Cache": cache_status}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored on both sides
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag.removeprefix("W/") in tags or "*" in tags:
+            # GZipMiddleware adds Vary: Accept-Encoding to bodies only; the 304 needs it as well
+            return Response(status_code=304, headers={**headers, "Vary": "Accept-Encoding"})
+    return Response(content=content, media_type="application/json", headers=headers)
 
-    logger.info(
-        {
-            "endpoint": "/generate-scouting-report",
-            "event": "request",
-            "team_name": body.team_name,
-            "match_limit": body.match_limit,
-        }
-    )
 
+@lru_cache(maxsize=1)
+def _empty_analysis() -> dict[str, Any]:
+    """Analyzer + counter-strategy output for zero matches (computed once; callers deep-copy it)."""
+    combined_analysis = {
+        "team_strategy": analyze_team_strategy([]),
+        "player_tendencies": analyze_player_tendencies([]),
+        "team_compositions": analyze_team_compositions([]),
+    }
+    return {**combined_analysis, "counter_strategies": generate_counter_strategies(combined_analysis)}
+
+
+async def _build_report(body: ScoutingReportRequest, cache_key: tuple[str, int]) -> tuple[int, bytes, str]:
+    """
+    Fetch, parse and analyze matches for one report; returns (matches_analyzed, encoded body, ETag).
+
+    Raises HTTPException 503/502 for GRID configuration/request failures.
+    """
     try:
-        try:
-            raw = fetch_team_matches(body.team_name, body.match_limit)
-        except ValueError as e:
-            logger.warning(
-                {
-                    "endpoint": "/generate-scouting-report",
-                    "event": "upstream_error",
-                    "error": str(e),
-                }
-            )
-            raise HTTPException(status_code=503, detail=str(e)) from e
-        except Exception as e:
-            logger.exception(
-                {
-                    "endpoint": "/generate-scouting-report",
-                    "event": "upstream_error",
-                    "error": str(e),
-                }
-            )
-            raise HTTPException(status_code=502, detail="GRID request failed.") from e
-
-        team_info = raw.get("team")
-        edges = (raw.get("data") or {}).get("allSeries", {}).get("edges", [])
-        match_data_list: list[dict[str, Any]] = []
-        for edge in edges:
-            node = edge.get("node") if isinstance(edge, dict) else None
-            if node:
-                parsed = parse_match_data({"node": node})
-                match_data_list.append(parsed)
-
-        # If GRID returned zero matches, fall back to sample mock data so scouting still produces output
-        mock_data_used = False
-        if len(match_data_list) == 0:
-            from app.mock_data import get_mock_match_data
-            match_data_list = get_mock_match_data(body.team_name, num_matches=min(5, body.match_limit))
-            if not team_info:
-                team_info = {"id": "mock", "name": body.team_name}
-            mock_data_used = True
+        raw = await fetch_team_matches(body.team_name, body.match_limit, force_refresh=body.force_refresh)
+    except ValueError as e:
+        logger.warning(
+            {
+                "endpoint": "/generate-scouting-report",
+                "event": "upstream_error",
+                "error": str(e),
+            }
+        )
+        raise HTTPException(status_code=503, detail=str(e)) from e
+    except Exception as e:
+        logger.exception(
+            {
+                "endpoint": "/generate-scouting-report",
+                "event": "upstream_error",
+                "error": str(e),
+            }
+        )
+        raise HTTPException(status_code=502, detail="GRID request failed.") from e
+
+    team_info = raw.get("team")
+    data = raw.get("data")
+    all_series = data.get("allSeries") if data else None
+    edges = (all_series.get("edges") if all_series else None) or ()
+    # match_limit <= 50 fits in one allSeries page, so there is no later page to overlap
+    # parsing with; the parse runs inline rather than per-node in threads.
+    match_data_list = parse_match_batch(edges)
+
+    # No matches and no mock fallback: the analysis of an empty list is constant, so skip it
+    if not match_data_list and not body.mock_fallback:
+        response = {
+            "team": team_info,
+            "matches_analyzed": 0,
+            "mock_data_used": False,
+            **copy.deepcopy(_empty_analysis()),
+        }
+        content = dumps_bytes(response)
+        return 0, content, _etag(content)
+
+    # If GRID returned zero matches, fall back to sample mock data so scouting still produces output
+    mock_data_used = False
+    if len(match_data_list) == 0:
+        match_data_list = get_mock_match_data(body.team_name, num_matches=min(5, body.match_limit))
+        if not team_info:
+            team_info = {"id": "mock", "name": body.team_name}
+        mock_data_used = True
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 {
                     "endpoint": "/generate-scouting-report",
@@ -87,33 +163,99 @@ def generate_scouting_report(body: ScoutingReportRequest) -> dict[str, Any]:
                 }
             )
 
-        team_strategy = analyze_team_strategy(match_data_list)
-        player_tendencies = analyze_player_tendencies(match_data_list)
-        team_compositions = analyze_team_compositions(match_data_list)
-        combined_analysis = {
-            "team_strategy": team_strategy,
-            "player_tendencies": player_tendencies,
-            "team_compositions": team_compositions,
-        }
-        counter_strategies = generate_counter_strategies(combined_analysis)
+    # The analyzers only read match_data_list; run them off the event loop (in worker
+    # processes when SCOUTING_PROCESS_WORKERS is set, otherwise in threads)
+    team_strategy, player_tendencies, team_compositions = await asyncio.gather(
+        _run_analyzer(analyze_team_strategy, match_data_list),
+        _run_analyzer(analyze_player_tendencies, match_data_list),
+        _run_analyzer(analyze_team_compositions, match_data_list),
+    )
+    combined_analysis = {
+        "team_strategy": team_strategy,
+        "player_tendencies": player_tendencies,
+        "team_compositions": team_compositions,
+    }
+    counter_strategies = generate_counter_strategies(combined_analysis)
 
-        response = {
-            "team": team_info,
-            "matches_analyzed": len(match_data_list),
-            "mock_data_used": mock_data_used,
-            "team_strategy": team_strategy,
-            "player_tendencies": player_tendencies,
-            "team_compositions": team_compositions,
-            "counter_strategies": counter_strategies,
-        }
+    response = {
+        "team": team_info,
+        "matches_analyzed": len(match_data_list),
+        "mock_data_used": mock_data_used,
+        "team_strategy": team_strategy,
+        "player_tendencies": player_tendencies,
+        "team_compositions": team_compositions,
+        "counter_strategies": counter_strategies,
+    }
+    content = dumps_bytes(response)
+    entry = (len(match_data_list), content, _etag(content))
+    if not mock_data_used:
+        _REPORT_CACHE.set(cache_key, entry)
+    return entry
+
+
+@router.post("/generate-scouting-report", response_model=dict[str, Any])
+async def generate_scouting_report(
+    body: ScoutingReportRequest, request: Request
+) -> dict[str, Any] | Response:
+    """
+    Generate a combined scouting report for a team.
+
+    Fetches matches from GRID, parses them, runs scouting engines (team strategy,
+    player tendencies, team compositions), and counter strategy engine.
+    Returns combined JSON report. Reports are cached for SCOUTING_REPORT_CACHE_TTL
+    seconds per (team_name, match_limit); force_refresh bypasses the cache.
+    Concurrent identical requests share one in-flight build.
+    Reports carry an ETag; a matching If-None-Match gets 304 Not Modified.
+    The X-Cache header says whether the report came from the cache (hit) or was built (miss).
+    """
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             {
                 "endpoint": "/generate-scouting-report",
-                "event": "response",
-                "matches_analyzed": response["matches_analyzed"],
+                "event": "request",
+                "team_name": body.team_name,
+                "match_limit": body.match_limit,
             }
         )
-        return response
+
+    cache_key = (body.team_name.lower(), body.match_limit)
+    if not body.force_refresh:
+        cached = _REPORT_CACHE.get(cache_key)
+        if cached is not None:
+            matches_analyzed, content, etag = cached
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    {
+                        "endpoint": "/generate-scouting-report",
+                        "event": "response",
+                        "matches_analyzed": matches_analyzed,
+                        "cache_hit": True,
+                    }
+                )
+            return _report_response(request, content, etag, "hit")
+
+    try:
+        flight_key = (*cache_key, body.force_refresh, body.mock_fallback)
+        task = _INFLIGHT.get(flight_key)
+        if task is None:
+            task = asyncio.create_task(_build_report(body, cache_key))
+            _INFLIGHT[flight_key] = task
+
+            def _done(done: asyncio.Task[tuple[int, bytes, str]]) -> None:
+                if _INFLIGHT.get(flight_key) is done:
+                    del _INFLIGHT[flight_key]
+
+            task.add_done_callback(_done)
+        matches_analyzed, content, etag = await asyncio.shield(task)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                {
+                    "endpoint": "/generate-scouting-report",
+                    "event": "response",
+                    "matches_analyzed": matches_analyzed,
+                }
+            )
+        return _report_response(request, content, etag, "miss")
     except HTTPException:
         raise
     except Exception as exc:
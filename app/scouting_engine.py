@@ -1,6 +1,10 @@
 """Scouting engine: team strategy analysis from match data."""
 
 import math
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
@@ -16,70 +20,61 @@ GAME_LENGTH_SHORT_MAX_MIN = 25
 GAME_LENGTH_LONG_MIN_MIN = 35
 RISK_VOLATILITY_HIGH = 60
 RISK_VOLATILITY_MEDIUM = 30
+_LEVEL_LABELS = ("low", "medium", "high")
 
+# Alternative key names for per-player stat fields
+_KILLS_KEYS = ("kills", "k")
+_DEATHS_KEYS = ("deaths", "d")
 
-def _safe_mean(values: list[float], default: float = 0.0) -> float:
-    """Return mean of non-None numeric values, or default."""
-    nums = [v for v in values if v is not None and not math.isnan(v)]
-    if not nums:
-        return default
-    return sum(nums) / len(nums)
+
+def _first_value(d: dict[str, Any], keys: tuple[str, ...], default: Any = None) -> Any:
+    """Return the first non-None value among keys (0 counts as a value), or default."""
+    for key in keys:
+        value = d.get(key)
+        if value is not None:
+            return value
+    return default
 
 
 def _safe_std(values: list[float], default: float = 0.0) -> float:
-    """Return sample std dev of non-None numeric values, or default."""
-    nums = [v for v in values if v is not None and not math.isnan(v)]
-    if len(nums) < 2:
+    """Return sample std dev of non-None numeric values, or default (one pass, Welford's update)."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for v in values:
+        if v is None or math.isnan(v):
+            continue
+        n += 1
+        delta = v - mean
+        mean += delta / n
+        m2 += delta * (v - mean)
+    if n < 2:
         return default
-    mean = sum(nums) / len(nums)
-    variance = sum((x - mean) ** 2 for x in nums) / (len(nums) - 1)
-    return math.sqrt(variance)
+    return math.sqrt(m2 / (n - 1))
 
 
-def _get_duration_seconds(match: dict[str, Any]) -> float | None:
-    """Get match duration from match data (explicit or from last objective)."""
-    # Explicit duration (if added to parsed data or raw)
+def _explicit_duration_seconds(match: dict[str, Any]) -> float | None:
+    """Get an explicit match duration (if added to parsed data or raw), else None."""
     duration = match.get("duration_seconds") or match.get("durationSeconds") or match.get("game_length")
     if duration is not None:
         try:
             return float(duration)
         except (TypeError, ValueError):
             pass
-    # Infer from latest objective timing
-    objs = match.get("objective_timings") or []
-    if not objs:
-        return None
-    times = []
-    for o in objs:
-        if not isinstance(o, dict):
-            continue
-        t = o.get("time_seconds") or o.get("timeSeconds") or o.get("time")
-        if t is not None:
-            try:
-                times.append(float(t))
-            except (TypeError, ValueError):
-                pass
-    return max(times) if times else None
+    return None
+
+
+def _level(score: float, medium: float, high: float) -> str:
+    """'low' below medium, 'medium' from medium up to high, 'high' from high up."""
+    return _LEVEL_LABELS[bisect_right((medium, high), score)]
 
 
 def _early_aggression_score_and_label(score: float) -> dict[str, Any]:
-    if score >= EARLY_AGGRESSION_HIGH:
-        label = "high"
-    elif score >= EARLY_AGGRESSION_MEDIUM:
-        label = "medium"
-    else:
-        label = "low"
-    return {"score": round(score, 2), "classification": label}
+    return {"score": round(score, 2), "classification": _level(score, EARLY_AGGRESSION_MEDIUM, EARLY_AGGRESSION_HIGH)}
 
 
 def _objective_contest_rate_and_label(rate: float) -> dict[str, Any]:
-    if rate >= OBJECTIVE_CONTEST_HIGH:
-        label = "high"
-    elif rate >= OBJECTIVE_CONTEST_MEDIUM:
-        label = "medium"
-    else:
-        label = "low"
-    return {"score": round(rate, 2), "classification": label}
+    return {"score": round(rate, 2), "classification": _level(rate, OBJECTIVE_CONTEST_MEDIUM, OBJECTIVE_CONTEST_HIGH)}
 
 
 def _game_length_and_label(avg_seconds: float) -> dict[str, Any]:
@@ -98,13 +93,7 @@ def _game_length_and_label(avg_seconds: float) -> dict[str, Any]:
 
 
 def _risk_volatility_and_label(score: float) -> dict[str, Any]:
-    if score >= RISK_VOLATILITY_HIGH:
-        label = "high"
-    elif score >= RISK_VOLATILITY_MEDIUM:
-        label = "medium"
-    else:
-        label = "low"
-    return {"score": round(score, 2), "classification": label}
+    return {"score": round(score, 2), "classification": _level(score, RISK_VOLATILITY_MEDIUM, RISK_VOLATILITY_HIGH)}
 
 
 def analyze_team_strategy(match_data_list: list[dict[str, Any]]) -> dict[str, Any]:
@@ -133,75 +122,92 @@ def analyze_team_strategy(match_data_list: list[dict[str, Any]]) -> dict[str, An
         }
     matches = [m for m in match_data_list if isinstance(m, dict)]
 
-    # --- Early aggression: share of objectives in first 15 min per match, then average ---
-    early_ratios: list[float] = []
+    # A single row-wise pass over matches feeds all four metrics (each match dict is visited once):
+    #   - early aggression: share of objectives in first 15 min per match, then average
+    #   - objective contest rate: % of matches where both teams have >= 1 objective
+    #   - average game length: explicit duration, else time of the last objective
+    #   - risk volatility: std of per-match sum of (kills - deaths) over all players
+    # Means and the std are accumulated as they go (sum/count, Welford) rather than from lists.
+    early_ratio_sum = 0.0
+    early_ratio_count = 0
+    contested_count = 0
+    duration_sum = 0.0
+    duration_count = 0
+    score_count = 0
+    score_mean = 0.0
+    score_m2 = 0.0
+    early_cutoff = EARLY_PHASE_SECONDS
     for m in matches:
         objs = m.get("objective_timings") or []
-        if not objs:
-            continue
         early = 0
         total = 0
+        last_time: float | None = None
+        team_ids = set()
+        contested = False
         for o in objs:
             if not isinstance(o, dict):
                 continue
-            t = o.get("time_seconds") or o.get("timeSeconds") or o.get("time")
+            t = o.get("time_seconds")
+            if t is None:
+                t = o.get("timeSeconds")
+                if t is None:
+                    t = o.get("time")
             if t is not None:
+                total += 1
                 try:
-                    total += 1
-                    if float(t) <= EARLY_PHASE_SECONDS:
-                        early += 1
+                    t = float(t)
                 except (TypeError, ValueError):
                     pass
+                else:
+                    if last_time is None or t > last_time:
+                        last_time = t
+                    if t <= early_cutoff:
+                        early += 1
+            # The timing stats need every objective, but contest only needs two distinct team ids
+            if not contested:
+                tid = o.get("team_id") or o.get("teamId")
+                if tid is not None:
+                    team_ids.add(tid if type(tid) is str else str(tid))
+                    contested = len(team_ids) >= 2
         if total > 0:
-            early_ratios.append(100.0 * early / total)
-    early_aggression_value = _safe_mean(early_ratios, 0.0)
-    early_aggression_value = min(100.0, max(0.0, early_aggression_value))
-
-    # --- Objective contest rate: % of matches where both teams have ≥1 objective ---
-    contested_count = 0
-    for m in matches:
-        objs = m.get("objective_timings") or []
-        team_ids = set()
-        for o in objs:
-            if not isinstance(o, dict):
-                continue
-            tid = o.get("team_id") or o.get("teamId")
-            if tid is not None:
-                team_ids.add(str(tid))
-        if len(team_ids) >= 2:
+            early_ratio_sum += 100.0 * early / total
+            early_ratio_count += 1
+        if contested:
             contested_count += 1
-    objective_contest_value = 100.0 * contested_count / len(matches) if matches else 0.0
-    objective_contest_value = min(100.0, max(0.0, objective_contest_value))
-
-    # --- Average game length (seconds), from duration or last objective ---
-    durations: list[float] = []
-    for m in matches:
-        d = _get_duration_seconds(m)
-        if d is not None and d > 0:
-            durations.append(d)
-    avg_duration_seconds = _safe_mean(durations, 0.0)
-    avg_duration_seconds = max(0.0, avg_duration_seconds)
+        duration = _explicit_duration_seconds(m)
+        if duration is None:
+            duration = last_time
+        if duration is not None and duration > 0:
+            duration_sum += duration
+            duration_count += 1
 
-    # --- Risk volatility: std of per-match performance (e.g. total kills per team), normalized 0–100 ---
-    # Per-match performance = sum of (kills - deaths) over all players, or total kills as proxy
-    per_match_scores: list[float] = []
-    for m in matches:
-        stats = m.get("player_stats") or []
         total_kills = 0.0
         total_deaths = 0.0
-        for p in stats:
+        for p in m.get("player_stats") or []:
             if not isinstance(p, dict):
                 continue
-            k = p.get("kills") or p.get("k") or 0
-            d = p.get("deaths") or p.get("d") or 0
+            k = _first_value(p, _KILLS_KEYS, 0)
+            d = _first_value(p, _DEATHS_KEYS, 0)
             try:
                 total_kills += float(k)
                 total_deaths += float(d)
             except (TypeError, ValueError):
                 pass
-        # Use (kills - deaths) as performance; variance across matches = volatility
-        per_match_scores.append(total_kills - total_deaths)
-    volatility_std = _safe_std(per_match_scores, 0.0)
+        score = total_kills - total_deaths
+        if not math.isnan(score):
+            score_count += 1
+            delta = score - score_mean
+            score_mean += delta / score_count
+            score_m2 += delta * (score - score_mean)
+
+    early_aggression_value = early_ratio_sum / early_ratio_count if early_ratio_count else 0.0
+    early_aggression_value = min(100.0, max(0.0, early_aggression_value))
+    objective_contest_value = 100.0 * contested_count / len(matches) if matches else 0.0
+    objective_contest_value = min(100.0, max(0.0, objective_contest_value))
+    avg_duration_seconds = duration_sum / duration_count if duration_count else 0.0
+    avg_duration_seconds = max(0.0, avg_duration_seconds)
+
+    volatility_std = math.sqrt(score_m2 / (score_count - 1)) if score_count >= 2 else 0.0
     # Normalize to 0–100: assume std in 0–20 is typical, cap at 20 for scaling
     volatility_value = min(100.0, max(0.0, (volatility_std / 20.0) * 100.0)) if volatility_std else 0.0
 
@@ -221,6 +227,19 @@ PERF_VARIANCE_HIGH = 15  # std of (k - d) across games
 PERF_VARIANCE_MEDIUM = 8
 
 
+@dataclass(slots=True)
+class _PlayerMatch:
+    """One player's line in one match, as aggregated by analyze_player_tendencies."""
+
+    match_id: Any
+    team_id: str
+    opponent_team_id: str | None
+    won: bool
+    kills: float
+    deaths: float
+    champion: str | None
+
+
 def _champion_from_player_stat(p: dict[str, Any]) -> str | None:
     """Get champion/hero/selection for a player stat row if present."""
     if not isinstance(p, dict):
@@ -228,19 +247,36 @@ def _champion_from_player_stat(p: dict[str, Any]) -> str | None:
     return p.get("champion") or p.get("selection") or p.get("hero") or p.get("pick")
 
 
+def _pick_order(pick: dict[str, Any]) -> float:
+    """Sort key for a draft pick: its numeric pick order, else 0."""
+    o = pick.get("pick_order") or pick.get("order")
+    if o is not None and isinstance(o, (int, float)):
+        return float(o)
+    return 0.0
+
+
+def _player_sort_key(p: dict[str, Any]) -> str:
+    """Sort key for a player stat row: its player id as a string."""
+    return str(p.get("player_id") or p.get("playerId") or "")
+
+
+def _count_desc(item: tuple[str, int]) -> int:
+    """Sort key for (name, count) pairs: highest count first."""
+    return -item[1]
+
+
 def _get_player_champions_for_match(match: dict[str, Any]) -> dict[str, str]:
     """
     Return map player_id -> champion for one match.
     Uses player_stats.champion if set; else infers from draft_picks by team + order.
     """
     result: dict[str, str] = {}
-    stats = match.get("player_stats") or []
+    # player_stats is walked twice below; drop malformed rows once
+    stats = [p for p in match.get("player_stats") or [] if isinstance(p, dict)]
     picks = match.get("draft_picks") or []
 
     # Direct champion on player_stats
     for p in stats:
-        if not isinstance(p, dict):
-            continue
         pid = p.get("player_id") or p.get("playerId")
         ch = _champion_from_player_stat(p)
         if pid is not None and ch is not None:
@@ -257,31 +293,18 @@ def _get_player_champions_for_match(match: dict[str, Any]) -> dict[str, str]:
         tid = pick.get("team_id") or pick.get("teamId")
         if tid is None:
             continue
-        tid = str(tid)
-        if tid not in picks_by_team:
-            picks_by_team[tid] = []
-        picks_by_team[tid].append(pick)
-    for tid in picks_by_team:
-        def _pick_order(x: dict[str, Any]) -> float:
-            o = x.get("pick_order") or x.get("order")
-            if o is not None and isinstance(o, (int, float)):
-                return float(o)
-            return 0.0
-        picks_by_team[tid].sort(key=_pick_order)
+        picks_by_team.setdefault(tid if type(tid) is str else str(tid), []).append(pick)
+    for team_picks in picks_by_team.values():
+        team_picks.sort(key=_pick_order)
 
     players_by_team: dict[str, list[dict[str, Any]]] = {}
     for p in stats:
-        if not isinstance(p, dict):
-            continue
         tid = p.get("team_id") or p.get("teamId")
         if tid is None:
             continue
-        tid = str(tid)
-        if tid not in players_by_team:
-            players_by_team[tid] = []
-        players_by_team[tid].append(p)
-    for tid in players_by_team:
-        players_by_team[tid].sort(key=lambda x: str(x.get("player_id") or x.get("playerId") or ""))
+        players_by_team.setdefault(tid if type(tid) is str else str(tid), []).append(p)
+    for plist in players_by_team.values():
+        plist.sort(key=_player_sort_key)
 
     for tid, plist in players_by_team.items():
         team_picks = picks_by_team.get(tid) or []
@@ -319,9 +342,8 @@ def analyze_player_tendencies(match_data_list: list[dict[str, Any]]) -> dict[str
     matches = [m for m in match_data_list if isinstance(m, dict)]
 
     # Aggregate per player across matches
-    player_matches: dict[str, list[dict[str, Any]]] = {}  # player_id -> list of match context
+    player_matches: dict[str, list[_PlayerMatch]] = {}  # player_id -> one record per match played
     player_names: dict[str, str] = {}
-    # match context: { "match_id", "team_id", "opponent_team_id", "won", "kills", "deaths", "champion" }
 
     for m in matches:
         match_id = m.get("match_id") or m.get("id") or ""
@@ -331,6 +353,8 @@ def analyze_player_tendencies(match_data_list: list[dict[str, Any]]) -> dict[str
         teams = m.get("teams") or []
         team_ids = [str(t.get("id") or t.get("teamId") or "") for t in teams if isinstance(t, dict) and (t.get("id") or t.get("teamId"))]
         player_to_champ = _get_player_champions_for_match(m)
+        winner_id = winner.get("id") if isinstance(winner, dict) else winner
+        winner_key = None if winner_id is None else str(winner_id)
 
         for p in m.get("player_stats") or []:
             if not isinstance(p, dict):
@@ -338,63 +362,68 @@ def analyze_player_tendencies(match_data_list: list[dict[str, Any]]) -> dict[str
             pid = p.get("player_id") or p.get("playerId")
             if pid is None:
                 continue
-            pid = str(pid)
+            if type(pid) is not str:
+                pid = str(pid)
             name = p.get("player_name") or p.get("nickname")
             if name or pid not in player_names:
                 player_names[pid] = name or pid
             team_id = str(p.get("team_id") or p.get("teamId") or "")
             opponent_ids = [t for t in team_ids if t and t != team_id]
             opponent_team_id = opponent_ids[0] if opponent_ids else None
-            winner_id = winner.get("id") if isinstance(winner, dict) else winner
-            won = winner_id is not None and str(winner_id) == team_id
+            won = winner_key == team_id
             try:
-                kills = float(p.get("kills") or p.get("k") or 0)
+                kills = float(_first_value(p, _KILLS_KEYS, 0))
             except (TypeError, ValueError):
                 kills = 0.0
             try:
-                deaths = float(p.get("deaths") or p.get("d") or 0)
+                deaths = float(_first_value(p, _DEATHS_KEYS, 0))
             except (TypeError, ValueError):
                 deaths = 0.0
             champion = player_to_champ.get(pid)
 
             if pid not in player_matches:
                 player_matches[pid] = []
-            player_matches[pid].append({
-                "match_id": match_id,
-                "team_id": team_id,
-                "opponent_team_id": opponent_team_id,
-                "won": won,
-                "kills": kills,
-                "deaths": deaths,
-                "champion": champion,
-            })
+            player_matches[pid].append(
+                _PlayerMatch(match_id, team_id, opponent_team_id, won, kills, deaths, champion)
+            )
 
     # Build output per player
     players_out: dict[str, Any] = {}
     for pid, contexts in player_matches.items():
         total = len(contexts)
-        # Most played champions
+        # One pass over the player's matches feeds every reduction below
+        # (plain dicts: Counter's __missing__/__iadd__ path is about 2x slower on these small tallies)
         champ_counts: dict[str, int] = {}
+        early_death_matches = 0
+        perf_list: list[float] = []
+        wins = 0
+        opp_games: dict[str, int] = {}
+        opp_wins: dict[str, int] = {}
         for ctx in contexts:
-            ch = ctx.get("champion") or "unknown"
+            ch = ctx.champion or "unknown"
             champ_counts[ch] = champ_counts.get(ch, 0) + 1
-        most_played = sorted(
-            [{"champion": ch, "games": c} for ch, c in champ_counts.items()],
-            key=lambda x: -x["games"],
-        )[:10]
+            if ctx.deaths >= 2:
+                early_death_matches += 1
+            perf_list.append(ctx.kills - ctx.deaths)
+            if ctx.won:
+                wins += 1
+            opp = ctx.opponent_team_id
+            if opp:
+                opp_games[opp] = opp_games.get(opp, 0) + 1
+                if ctx.won:
+                    opp_wins[opp] = opp_wins.get(opp, 0) + 1
+
+        # Most played champions (stable sort: ties keep first-seen order)
+        most_played = [
+            {"champion": ch, "games": c}
+            for ch, c in sorted(champ_counts.items(), key=_count_desc)[:10]
+        ]
 
         # Early death frequency: % of matches with 2+ deaths
-        early_death_matches = sum(1 for ctx in contexts if (ctx.get("deaths") or 0) >= 2)
         early_death_rate = (100.0 * early_death_matches / total) if total else 0.0
-        if early_death_rate >= EARLY_DEATH_HIGH:
-            early_label = "high"
-        elif early_death_rate >= EARLY_DEATH_MEDIUM:
-            early_label = "medium"
-        else:
-            early_label = "low"
+        early_label = _level(early_death_rate, EARLY_DEATH_MEDIUM, EARLY_DEATH_HIGH)
 
         # Performance variance: (kills - deaths) per match, then std
-        perf_list = [ (ctx.get("kills") or 0) - (ctx.get("deaths") or 0) for ctx in contexts ]
         std_perf = _safe_std(perf_list, 0.0)
         var_perf = (std_perf ** 2) if std_perf else 0.0
         if std_perf >= PERF_VARIANCE_HIGH:
@@ -405,22 +434,11 @@ def analyze_player_tendencies(match_data_list: list[dict[str, Any]]) -> dict[str
             perf_label = "low"
 
         # Matchup winrate: overall and by opponent
-        wins = sum(1 for ctx in contexts if ctx.get("won"))
         overall_wr = (100.0 * wins / total) if total else 0.0
-        by_opponent: dict[str, Any] = {}
-        for ctx in contexts:
-            opp = ctx.get("opponent_team_id")
-            if opp is None or opp == "":
-                continue
-            opp = str(opp)
-            if opp not in by_opponent:
-                by_opponent[opp] = {"wins": 0, "games": 0}
-            by_opponent[opp]["games"] += 1
-            if ctx.get("won"):
-                by_opponent[opp]["wins"] += 1
-        for opp, data in by_opponent.items():
-            g = data["games"]
-            data["win_rate"] = round((100.0 * data["wins"] / g), 2) if g else 0.0
+        by_opponent = {
+            opp: {"wins": (w := opp_wins.get(opp, 0)), "games": g, "win_rate": round(100.0 * w / g, 2)}
+            for opp, g in opp_games.items()
+        }
 
         players_out[pid] = {
             "player_id": pid,
@@ -473,47 +491,61 @@ CHAMPION_ARCHETYPES: dict[str, str] = {
 }
 
 
-def _get_team_composition(match: dict[str, Any], team_id: str) -> list[str]:
-    """Return sorted list of champion names for one team in a match from draft_picks."""
-    picks = match.get("draft_picks") or []
-    champs: list[str] = []
-    for p in picks:
+def _get_team_compositions(match: dict[str, Any]) -> dict[str, list[str]]:
+    """Return team_id (as str) -> sorted list of champion names, from one pass over draft_picks."""
+    comps: dict[str, list[str]] = {}
+    for p in match.get("draft_picks") or []:
         if not isinstance(p, dict):
             continue
-        tid = p.get("team_id") or p.get("teamId")
-        if str(tid) != str(team_id):
-            continue
         ch = p.get("selection") or p.get("champion") or p.get("hero")
-        if ch is not None:
-            champs.append(str(ch).strip())
-    champs.sort(key=str.lower)
-    return champs
+        if ch is None:
+            continue
+        tid = p.get("team_id") or p.get("teamId")
+        comps.setdefault(tid if type(tid) is str else str(tid), []).append(str(ch).strip())
+    for champs in comps.values():
+        champs.sort(key=str.lower)
+    return comps
 
 
-def _classify_comp(champion_list: list[str]) -> str:
+def _classify_comp(champion_list: tuple[str, ...]) -> str:
     """
     Classify composition by champion archetypes: teamfight, pick, scaling, split_push, etc.
     Returns majority archetype, or 'mixed' if no majority, or 'unknown' if no champions mapped.
     """
+    return _classify_comp_cached(tuple(ch.lower() for ch in champion_list))
+
+
+@lru_cache(maxsize=4096)
+def _classify_comp_cached(champion_list: tuple[str, ...]) -> str:
+    """_classify_comp() on lowercased names, memoized per composition."""
     if not champion_list:
         return "unknown"
-    counts: dict[str, int] = {}
-    for ch in champion_list:
-        arch = CHAMPION_ARCHETYPES.get(ch.lower()) or CHAMPION_ARCHETYPES.get(ch.lower().replace(" ", ""))
+    counts: Counter[str] = Counter()
+    archetype_of = CHAMPION_ARCHETYPES.get
+    for name in champion_list:
+        arch = archetype_of(name)
+        if arch is None and " " in name:
+            arch = archetype_of(name.replace(" ", ""))
         if arch:
-            counts[arch] = counts.get(arch, 0) + 1
+            counts[arch] += 1
     if not counts:
         return "unknown"
     total_mapped = sum(counts.values())
     if total_mapped < len(champion_list) / 2:
         return "unknown"
-    best = max(counts.items(), key=lambda x: x[1])
-    if best[1] == total_mapped:
-        return best[0]
-    second = sorted(counts.values(), reverse=True)
-    if len(second) > 1 and second[0] == second[1]:
+    # Top two counts in one scan; ties keep the first archetype seen, as max() did
+    best = ""
+    first = second = 0
+    for arch, n in counts.items():
+        if n > first:
+            best, first, second = arch, n, first
+        elif n > second:
+            second = n
+    if first == total_mapped:
+        return best
+    if first == second:
         return "mixed"
-    return best[0]
+    return best
 
 
 def analyze_team_compositions(match_data_list: list[dict[str, Any]]) -> dict[str, Any]:
@@ -555,10 +587,11 @@ def analyze_team_compositions(match_data_list: list[dict[str, Any]]) -> dict[str
             draft = m.get("draft_picks") or []
             team_ids = list({str(p.get("team_id") or p.get("teamId")) for p in draft if isinstance(p, dict) and (p.get("team_id") or p.get("teamId"))})
 
+        comps_by_team = _get_team_compositions(m)
         for tid in team_ids:
             if not tid:
                 continue
-            comp_list = _get_team_composition(m, tid)
+            comp_list = comps_by_team.get(tid)
             if not comp_list:
                 continue
             comp_key = tuple(comp_list)
@@ -578,26 +611,20 @@ def analyze_team_compositions(match_data_list: list[dict[str, Any]]) -> dict[str
     for comp_key, outcomes in comp_list_sorted:
         games = len(outcomes)
         wins = sum(1 for w, _ in outcomes if w)
-        win_rate = (100.0 * wins / games) if games else 0.0
+        win_rate = round(100.0 * wins / games, 2) if games else 0.0
         comp_list = list(comp_key)
-        classification = _classify_comp(comp_list)
+        classification = _classify_comp(comp_key)
 
         comp_str = " | ".join(comp_list)
         entry = {
             "composition": comp_list,
             "games": games,
             "wins": wins,
-            "win_rate": round(win_rate, 2),
+            "win_rate": win_rate,
             "classification": classification,
         }
         compositions.append(entry)
-        by_comp[comp_str] = {
-            "composition": comp_list,
-            "games": games,
-            "wins": wins,
-            "win_rate": round(win_rate, 2),
-            "classification": classification,
-        }
+        by_comp[comp_str] = entry  # same object as in compositions; the output is read-only
 
     return {
         "compositions": compositions,
@@ -606,6 +633,36 @@ def analyze_team_compositions(match_data_list: list[dict[str, Any]]) -> dict[str
     }
 
 
+# Composition classification -> (counter strategy text, confidence with 3+ games, confidence with fewer)
+_COMP_STRATEGIES: dict[str, tuple[str, float, float]] = {
+    "scaling": (
+        "Opponent frequently plays scaling compositions. End the game early, secure objectives on spawn, and avoid letting them reach late-game power spikes.",
+        75.0,
+        60.0,
+    ),
+    "pick": (
+        "Opponent favors pick/skirmish comps. Stay grouped, ward flanks, and avoid isolated members; force teamfights where their pick potential is reduced.",
+        72.0,
+        58.0,
+    ),
+    "teamfight": (
+        "Opponent relies on teamfight comps. Either match with a stronger teamfight, split the map to avoid 5v5, or engage on your terms with pick or tempo advantages.",
+        68.0,
+        55.0,
+    ),
+    "split_push": (
+        "Opponent uses split-push comps. Group for objectives and force 5v4 or 5v3 when their splitter is away; control vision and punish overextension.",
+        70.0,
+        57.0,
+    ),
+}
+
+
+def _confidence(score: float) -> float:
+    """Confidence score capped to 0–100 and rounded to one decimal."""
+    return round(min(100.0, max(0.0, float(score))), 1)
+
+
 def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str, Any]:
     """
     Generate counter strategies from opponent team analysis, using weaknesses in the data.
@@ -649,13 +706,13 @@ def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str,
                     strategies.append({
                         "strategy_text": "Opponent shows low early aggression. Apply early pressure: invade, secure early objectives, and force skirmishes before they scale.",
                         "supporting_data": {"metric": "early_aggression", "score": score, "classification": label},
-                        "confidence_score": round(70 + (30 - score) / 30 * 20, 1),
+                        "confidence_score": _confidence(70 + (30 - score) / 30 * 20),
                     })
                 elif label == "high" and score >= 60:
                     strategies.append({
                         "strategy_text": "Opponent is highly aggressive early. Play safe in the early phase, avoid unnecessary fights, and prioritize scaling or counter-engage.",
                         "supporting_data": {"metric": "early_aggression", "score": score, "classification": label},
-                        "confidence_score": round(65 + min(score - 60, 30) / 30 * 15, 1),
+                        "confidence_score": _confidence(65 + min(score - 60, 30) / 30 * 15),
                     })
 
         oc = team_strategy.get("objective_contest_rate") or {}
@@ -666,7 +723,7 @@ def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str,
                 strategies.append({
                     "strategy_text": "Opponent has low objective contest rate. Contest every major objective; they are unlikely to commit fully, giving you control of map and tempo.",
                     "supporting_data": {"metric": "objective_contest_rate", "score": score, "classification": label},
-                    "confidence_score": round(72 + (40 - score) / 40 * 18, 1),
+                    "confidence_score": _confidence(72 + (40 - score) / 40 * 18),
                 })
 
         rv = team_strategy.get("risk_volatility") or {}
@@ -677,7 +734,7 @@ def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str,
                 strategies.append({
                     "strategy_text": "Opponent shows high performance volatility. They are inconsistent game-to-game; apply sustained pressure when they are behind and avoid overcommitting when they are ahead.",
                     "supporting_data": {"metric": "risk_volatility", "score": score, "classification": label},
-                    "confidence_score": round(60 + min(score, 40) / 40 * 25, 1),
+                    "confidence_score": _confidence(60 + min(score, 40) / 40 * 25),
                 })
 
         gl = team_strategy.get("average_game_length") or {}
@@ -689,13 +746,13 @@ def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str,
                     strategies.append({
                         "strategy_text": "Opponent tends to win in short games. Either match their tempo with early power or drag the game out and scale to deny their preferred timeline.",
                         "supporting_data": {"metric": "average_game_length", "average_minutes": mins, "classification": label},
-                        "confidence_score": round(68, 1),
+                        "confidence_score": 68.0,
                     })
                 elif label == "long":
                     strategies.append({
                         "strategy_text": "Opponent excels in long games. Push for an early lead and close before late game; avoid extended stall if you are not a scaling comp.",
                         "supporting_data": {"metric": "average_game_length", "average_minutes": mins, "classification": label},
-                        "confidence_score": round(70, 1),
+                        "confidence_score": 70.0,
                     })
 
     # --- Counter strategies from player tendencies ---
@@ -709,7 +766,7 @@ def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str,
             strategies.append({
                 "strategy_text": f"Target player {name} early; they have a high early-death frequency and are likely to give leads if pressured.",
                 "supporting_data": {"player_id": pid, "player_name": name, "early_death_frequency": early},
-                "confidence_score": round(65 + min(early.get("rate", 0) - 60, 30) / 30 * 20, 1),
+                "confidence_score": _confidence(65 + min(early.get("rate", 0) - 60, 30) / 30 * 20),
             })
         mw = pdata.get("matchup_winrate") or {}
         if isinstance(mw, dict):
@@ -718,7 +775,7 @@ def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str,
                 strategies.append({
                     "strategy_text": f"Player {name} has a below-average win rate in the sample. Continue to deny them resources and priority; they underperform under pressure.",
                     "supporting_data": {"player_id": pid, "player_name": name, "matchup_winrate": overall},
-                    "confidence_score": round(55 + (45 - overall) / 45 * 25, 1),
+                    "confidence_score": _confidence(55 + (45 - overall) / 45 * 25),
                 })
 
     # --- Counter strategies from team compositions ---
@@ -726,38 +783,21 @@ def generate_counter_strategies(team_analysis_json: dict[str, Any]) -> dict[str,
     for c in comps[:10]:  # Top 10 most played comps
         if not isinstance(c, dict):
             continue
-        comp_list = c.get("composition") or []
-        classification = c.get("classification") or "unknown"
-        win_rate = c.get("win_rate")
+        classification = c.get("classification")
+        template = _COMP_STRATEGIES.get(classification)  # missing/unknown/mixed have no template
+        if template is None:
+            continue
+        text, confident, tentative = template
         games = c.get("games") or 0
-        if classification == "scaling":
-            strategies.append({
-                "strategy_text": "Opponent frequently plays scaling compositions. End the game early, secure objectives on spawn, and avoid letting them reach late-game power spikes.",
-                "supporting_data": {"composition": comp_list, "classification": classification, "win_rate": win_rate, "games": games},
-                "confidence_score": round(75 if games >= 3 else 60, 1),
-            })
-        elif classification == "pick":
-            strategies.append({
-                "strategy_text": "Opponent favors pick/skirmish comps. Stay grouped, ward flanks, and avoid isolated members; force teamfights where their pick potential is reduced.",
-                "supporting_data": {"composition": comp_list, "classification": classification, "win_rate": win_rate, "games": games},
-                "confidence_score": round(72 if games >= 3 else 58, 1),
-            })
-        elif classification == "teamfight":
-            strategies.append({
-                "strategy_text": "Opponent relies on teamfight comps. Either match with a stronger teamfight, split the map to avoid 5v5, or engage on your terms with pick or tempo advantages.",
-                "supporting_data": {"composition": comp_list, "classification": classification, "win_rate": win_rate, "games": games},
-                "confidence_score": round(68 if games >= 3 else 55, 1),
-            })
-        elif classification == "split_push":
-            strategies.append({
-                "strategy_text": "Opponent uses split-push comps. Group for objectives and force 5v4 or 5v3 when their splitter is away; control vision and punish overextension.",
-                "supporting_data": {"composition": comp_list, "classification": classification, "win_rate": win_rate, "games": games},
-                "confidence_score": round(70 if games >= 3 else 57, 1),
-            })
-
-    # Cap confidence at 100
-    for s in strategies:
-        if "confidence_score" in s and s["confidence_score"] is not None:
-            s["confidence_score"] = round(min(100.0, max(0.0, float(s["confidence_score"]))), 1)
+        strategies.append({
+            "strategy_text": text,
+            "supporting_data": {
+                "composition": c.get("composition") or [],
+                "classification": classification,
+                "win_rate": c.get("win_rate"),
+                "games": games,
+            },
+            "confidence_score": confident if games >= 3 else tentative,
+        })
 
     return {"strategies": strategies}
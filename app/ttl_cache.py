@@ -0,0 +1,37 @@
+"""Small in-process TTL + LRU cache shared by the GRID client and API routes."""
+
+import time
+from typing import Any
+
+
+class TTLCache:
+    """Minimal in-process TTL cache; evicts the least recently used entry when full. ttl <= 0 disables it.
+
+    Only touched from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any | None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            return None
+        self._data[key] = entry  # re-insert as most recently used
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._data.clear()
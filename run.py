@@ -1,16 +1,25 @@
 """
 Run the FastAPI app with host 0.0.0.0 and port from PORT env (e.g. Render).
 Usage: python run.py
+
+Workers come from WEB_CONCURRENCY (default 1). uvloop/httptools are used when
+installed (uvicorn[standard]; uvloop is not available on Windows).
 """
 import os
+from importlib.util import find_spec
 
 import uvicorn
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
+    workers = int(os.environ.get("WEB_CONCURRENCY") or 1)
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=False,
+        workers=max(1, workers),
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        log_level=os.environ.get("LOG_LEVEL", "info").lower(),
+        access_log=False,
     )
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Example test script using requests to call all Coach Command Center API endpoints.
+Example test script using httpx to call all Coach Command Center API endpoints.
 
 Usage:
     python scripts/test_endpoints.py [BASE_URL]
@@ -16,25 +16,41 @@ Endpoints exercised:
     POST /draft-risk-analysis       (draft: list of champion names)
     POST /coach-chat                (question, scouting_report)
     POST /coach-chat with invalid body (expect 422)
+
+The scouting report and draft risk requests are independent and run concurrently;
+/coach-chat waits for the scouting report it is given as context. All calls share one
+httpx client (HTTP/2 over TLS when the h2 package is installed).
 """
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from typing import Any
 
-import requests
+import httpx
+
+
+def _client(base_url: str) -> httpx.Client:
+    """Keep-alive client (thread-safe) with pooled connections and connect retries."""
+    # http2/limits go on the transport; httpx ignores the client-level ones when a transport is passed
+    transport = httpx.HTTPTransport(
+        retries=2,
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+    )
+    return httpx.Client(base_url=base_url, transport=transport, timeout=60)
 
 
 def main(base_url: str = "http://127.0.0.1:8000") -> int:
-    base_url = base_url.rstrip("/")
-    session = requests.Session()
-    session.headers["Content-Type"] = "application/json"
+    # One client for every call, including the concurrent checks; bodies are sent with json=
+    client = _client(base_url.rstrip("/"))
 
-    def get(path: str, **kwargs: Any) -> requests.Response:
-        return session.get(f"{base_url}{path}", timeout=30, **kwargs)
+    def get(path: str, **kwargs: Any) -> httpx.Response:
+        return client.get(path, timeout=30, **kwargs)
 
-    def post(path: str, json_data: dict[str, Any] | None = None, **kwargs: Any) -> requests.Response:
-        return session.post(f"{base_url}{path}", json=json_data or {}, timeout=60, **kwargs)
+    def post(path: str, json_data: dict[str, Any] | None = None, **kwargs: Any) -> httpx.Response:
+        return client.post(path, json=json_data or {}, **kwargs)
 
     errors: list[str] = []
     scouting_report: dict[str, Any] | None = None
@@ -51,38 +67,54 @@ def main(base_url: str = "http://127.0.0.1:8000") -> int:
         errors.append(f"GET /health: {e}")
         print(f"  FAIL: {e}")
 
-    # --- POST /generate-scouting-report ---
-    print("POST /generate-scouting-report ...")
-    try:
-        r = post("/generate-scouting-report", json_data={"team_name": "G2", "match_limit": 2})
-        r.raise_for_status()
-        scouting_report = r.json()
-        assert "matches_analyzed" in scouting_report
-        assert "team_strategy" in scouting_report
-        assert "counter_strategies" in scouting_report
-        print(f"  OK {r.status_code} matches_analyzed={scouting_report.get('matches_analyzed')}")
-    except requests.HTTPError as e:
-        errors.append(f"POST /generate-scouting-report: {e.response.status_code} {e.response.text[:200]}")
-        print(f"  FAIL: {e}")
-    except Exception as e:
-        errors.append(f"POST /generate-scouting-report: {e}")
-        print(f"  FAIL: {e}")
-
-    # --- POST /draft-risk-analysis ---
-    print("POST /draft-risk-analysis ...")
-    try:
-        r = post(
-            "/draft-risk-analysis",
-            json_data={"draft": ["Ahri", "Amumu", "Kayle", "Vayne", "Thresh"]},
-        )
-        r.raise_for_status()
-        data = r.json()
-        assert "synergy" in data and "damage_composition" in data
-        assert "role_coverage" in data and "risk_alerts" in data
-        print(f"  OK {r.status_code} synergy={data.get('synergy', {}).get('classification')} risk_alerts={len(data.get('risk_alerts', []))}")
-    except Exception as e:
-        errors.append(f"POST /draft-risk-analysis: {e}")
-        print(f"  FAIL: {e}")
+    # --- POST /generate-scouting-report and POST /draft-risk-analysis (concurrently) ---
+    # Each check returns (output lines, error or None) so results print in a fixed order.
+    def check_scouting_report() -> tuple[list[str], str | None, dict[str, Any] | None]:
+        lines = ["POST /generate-scouting-report ..."]
+        try:
+            r = post("/generate-scouting-report", json_data={"team_name": "G2", "match_limit": 2})
+            r.raise_for_status()
+            report = r.json()
+            assert "matches_analyzed" in report
+            assert "team_strategy" in report
+            assert "counter_strategies" in report
+            lines.append(f"  OK {r.status_code} matches_analyzed={report.get('matches_analyzed')}")
+            return lines, None, report
+        except httpx.HTTPStatusError as e:
+            lines.append(f"  FAIL: {e}")
+            return lines, f"POST /generate-scouting-report: {e.response.status_code} {e.response.text[:200]}", None
+        except Exception as e:
+            lines.append(f"  FAIL: {e}")
+            return lines, f"POST /generate-scouting-report: {e}", None
+
+    def check_draft_risk() -> tuple[list[str], str | None]:
+        lines = ["POST /draft-risk-analysis ..."]
+        try:
+            r = post(
+                "/draft-risk-analysis",
+                json_data={"draft": ["Ahri", "Amumu", "Kayle", "Vayne", "Thresh"]},
+            )
+            r.raise_for_status()
+            data = r.json()
+            assert "synergy" in data and "damage_composition" in data
+            assert "role_coverage" in data and "risk_alerts" in data
+            lines.append(f"  OK {r.status_code} synergy={data.get('synergy', {}).get('classification')} risk_alerts={len(data.get('risk_alerts', []))}")
+            return lines, None
+        except Exception as e:
+            lines.append(f"  FAIL: {e}")
+            return lines, f"POST /draft-risk-analysis: {e}"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        scouting_future = pool.submit(check_scouting_report)
+        draft_future = pool.submit(check_draft_risk)
+        lines, error, scouting_report = scouting_future.result()
+        print("\n".join(lines))
+        if error:
+            errors.append(error)
+        lines, error = draft_future.result()
+        print("\n".join(lines))
+        if error:
+            errors.append(error)
 
     # --- POST /coach-chat ---
     print("POST /coach-chat ...")
@@ -116,6 +148,8 @@ def main(base_url: str = "http://127.0.0.1:8000") -> int:
         errors.append(f"POST /coach-chat validation: {e}")
         print(f"  FAIL: {e}")
 
+    client.close()
+
     # --- Summary ---
     print()
     if errors:
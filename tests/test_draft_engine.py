@@ -0,0 +1,37 @@
+"""Tests for app.draft_engine."""
+
+import copy
+
+from app.draft_engine import evaluate_draft, evaluate_drafts_batch
+
+
+def test_mutating_a_result_does_not_leak_into_later_calls():
+    draft = ["Ahri", "Amumu"]
+    expected = copy.deepcopy(evaluate_draft(draft))
+
+    first = evaluate_draft(draft)
+    first["risk_alerts"].append({"severity": "info", "type": "test", "message": "added by caller"})
+    first["synergy"]["details"]["tag_counts"]["test"] = 1
+    first["role_coverage"]["missing_roles"].clear()
+    first["picks"][0]["tags"].append("test")
+
+    assert evaluate_draft(draft) == expected
+
+
+def test_batch_results_are_independent_copies():
+    a, b = evaluate_drafts_batch([["Ahri", "Amumu"], ["Ahri", "Amumu"]])
+    a["risk_alerts"].append({"severity": "info", "type": "test", "message": "added by caller"})
+    assert b == evaluate_draft(["Ahri", "Amumu"])
+    assert a != b
+
+
+def test_empty_draft_results_are_fresh_containers():
+    expected = copy.deepcopy(evaluate_draft([]))
+
+    first = evaluate_draft([])
+    first["synergy"]["details"]["test"] = 1
+    first["damage_composition"]["details"]["physical"] = 99
+    first["risk_alerts"].append({"severity": "info", "type": "test", "message": "added by caller"})
+
+    assert evaluate_draft([]) == expected
+    assert evaluate_draft(None) == expected
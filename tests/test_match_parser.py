@@ -0,0 +1,44 @@
+"""Tests for app.match_parser."""
+
+from app.match_parser import parse_match_data
+
+
+def _wrapped_edge():
+    # Edge carries the first-choice aliases, its node the fallback aliases: the node must win
+    return {
+        "teamId": "t2",
+        "selection": "Thresh",
+        "type": "tower",
+        "node": {"team_id": "t1", "hero": "Jinx", "objectiveType": "baron"},
+    }
+
+
+def test_wrapped_draft_pick_prefers_any_node_alias_over_edge_fields():
+    parsed = parse_match_data({"id": "m1", "draft": [_wrapped_edge()]})
+    pick = parsed["draft_picks"][0]
+    assert pick["team_id"] == "t1"
+    assert pick["selection"] == "Jinx"
+
+
+def test_wrapped_objective_prefers_any_node_alias_over_edge_fields():
+    parsed = parse_match_data({"id": "m1", "objectives": [_wrapped_edge()]})
+    objective = parsed["objective_timings"][0]
+    assert objective["team_id"] == "t1"
+    assert objective["type"] == "baron"
+
+
+def test_wrapped_item_falls_back_to_edge_fields():
+    edge = {"order": 3, "time": 600, "node": {"teamId": "t1"}}
+    parsed = parse_match_data({"id": "m1", "draft": [edge], "objectives": [edge]})
+    assert parsed["draft_picks"][0]["pick_order"] == 3
+    assert parsed["objective_timings"][0]["time_seconds"] == 600
+
+
+def test_zero_values_are_kept():
+    parsed = parse_match_data({
+        "id": "m1",
+        "draft": [{"order": 0, "pickOrder": 5, "teamId": "t1"}],
+        "playerStats": [{"player": {"id": "p1"}, "kills": 0, "k": 4}],
+    })
+    assert parsed["draft_picks"][0]["pick_order"] == 0
+    assert parsed["player_stats"][0]["kills"] == 0